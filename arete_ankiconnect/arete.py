@@ -18,6 +18,9 @@ ADDON_PATH = os.path.dirname(__file__)
 CONFIG_PATH = os.path.join(ADDON_PATH, "config.json")
 CONFIG = {}
 
+# Compiled once: get_obsidian_source runs on every reviewer action.
+HTML_TAG_RE = re.compile(r"<[^>]*>")
+
 
 def load_config():
     global CONFIG
@@ -37,24 +40,28 @@ def get_obsidian_source(note) -> tuple[str, str, int, str] | None:
     Extract Obsidian source info from note's _obsidian_source field.
     Returns (vault_name, file_path, card_index, arete_id) or None if not found.
     """
-    for field_name in note.keys():
-        if field_name == "_obsidian_source":
-            field_value = note[field_name]
-            if field_value:
-                # Strip HTML tags if any (legacy sync issues)
-                clean_value = re.sub(r"<[^>]*>", "", field_value).strip()
-
-                # Format: vault|path|line|arete_id
-                parts = clean_value.split("|")
-                if len(parts) >= 3:
-                    vault = parts[0]
-                    file_path = parts[1]
-                    try:
-                        card_idx = int(parts[2])
-                    except ValueError:
-                        card_idx = 1
-                    arete_id = parts[3] if len(parts) >= 4 else ""
-                    return vault, file_path, card_idx, arete_id
+    if "_obsidian_source" not in note.keys():
+        return None
+
+    field_value = note["_obsidian_source"]
+    if not field_value:
+        return None
+
+    # Strip HTML tags if any (legacy sync issues)
+    clean_value = HTML_TAG_RE.sub("", field_value).strip()
+
+    # Format: vault|path|line|arete_id — cap the splits so a stray "|"
+    # in the trailing id can't produce extra parts.
+    parts = clean_value.split("|", 3)
+    if len(parts) >= 3:
+        vault = parts[0]
+        file_path = parts[1]
+        try:
+            card_idx = int(parts[2])
+        except ValueError:
+            card_idx = 1
+        arete_id = parts[3] if len(parts) >= 4 else ""
+        return vault, file_path, card_idx, arete_id
     return None
 
 
@@ -8,6 +8,10 @@ ANKI_URL = os.getenv("ANKI_CONNECT_URL", "http://127.0.0.1:8766")
 MAX_RETRIES = 30  # 30 retries * 1 second = 30 seconds max wait
 DELAY = 1
 
+# One session for the whole poll loop so retries reuse the TCP connection
+# instead of paying socket setup (and TIME_WAIT churn) every second.
+_SESSION = requests.Session()
+
 
 def check_anki():
     # Try 127.0.0.1 first, then 0.0.0.0 as fallback for some Mac/OrbStack setups
@@ -17,7 +21,7 @@ def check_anki():
 
     for url in urls:
         try:
-            response = requests.post(url, json={"action": "version", "version": 6}, timeout=1)
+            response = _SESSION.post(url, json={"action": "version", "version": 6}, timeout=1)
             if response.status_code == 200:
                 print(f"Anki is ready at {url}! Version: {response.json()}")
                 return True
@@ -29,13 +33,16 @@ def check_anki():
 def main():
     print(f"Waiting for Anki (trying {ANKI_URL} and/or 0.0.0.0)...")
     sys.stdout.flush()
-    for i in range(MAX_RETRIES):
-        if check_anki():
-            sys.exit(0)
-        time.sleep(DELAY)
-        if (i + 1) % 5 == 0:
-            print(f"Still waiting... {i + 1}/{MAX_RETRIES} attempts")
-            sys.stdout.flush()
+    try:
+        for i in range(MAX_RETRIES):
+            if check_anki():
+                sys.exit(0)
+            time.sleep(DELAY)
+            if (i + 1) % 5 == 0:
+                print(f"Still waiting... {i + 1}/{MAX_RETRIES} attempts")
+                sys.stdout.flush()
+    finally:
+        _SESSION.close()
 
     print("Timed out waiting for Anki.")
     sys.exit(1)
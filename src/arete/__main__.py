@@ -1,4 +1,4 @@
-from arete.interface.cli import app
+from arete.interface.entry import main
 
 if __name__ == "__main__":
-    app()
+    main()
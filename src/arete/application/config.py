@@ -1,3 +1,4 @@
+import os
 from multiprocessing import cpu_count
 from pathlib import Path
 from typing import Any, Literal
@@ -122,6 +123,40 @@ class AppConfig(BaseSettings):
         return None
 
 
+# Resolution re-parses TOML and walks the filesystem, so repeated calls with
+# identical inputs — the same overrides within one CLI invocation, or per
+# request in the long-lived servers — are memoized. The key captures every
+# input resolution reads: overrides, config file mtimes, O2A_* environment,
+# home and cwd. Any change to those misses the cache and re-resolves.
+_resolve_cache: dict[tuple, AppConfig] = {}
+_RESOLVE_CACHE_MAX = 8
+
+
+def _config_cache_key(
+    cli_overrides: dict[str, Any] | None, config_file: Path | None
+) -> tuple | None:
+    """Hashable cache key for resolve_config, or None when not cacheable."""
+    home = Path.home()
+    files = (
+        [config_file] if config_file else [home / ".config/arete/config.toml", home / ".arete.toml"]
+    )
+    mtimes = []
+    for f in files:
+        try:
+            mtimes.append(f.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+
+    env = tuple(sorted((k, v) for k, v in os.environ.items() if k.startswith("O2A_")))
+    try:
+        overrides = tuple(sorted((cli_overrides or {}).items()))
+        hash(overrides)
+    except TypeError:
+        # Unhashable override value: skip caching rather than guess.
+        return None
+    return (overrides, config_file, tuple(mtimes), env, home, Path.cwd())
+
+
 def resolve_config(
     cli_overrides: dict[str, Any] | None = None, config_file: Path | None = None
 ) -> AppConfig:
@@ -131,7 +166,26 @@ def resolve_config(
     2. ~/.config/arete/config.toml (if exists) OR explicit config_file
     3. Environment variables (O2A_*)
     4. cli_overrides (passed from Typer).
+
+    Results are memoized per input set; treat the returned config as
+    read-only.
     """
+    key = _config_cache_key(cli_overrides, config_file)
+    if key is not None and key in _resolve_cache:
+        return _resolve_cache[key]
+
+    config = _resolve_config_uncached(cli_overrides, config_file)
+
+    if key is not None:
+        if len(_resolve_cache) >= _RESOLVE_CACHE_MAX:
+            _resolve_cache.clear()
+        _resolve_cache[key] = config
+    return config
+
+
+def _resolve_config_uncached(
+    cli_overrides: dict[str, Any] | None, config_file: Path | None
+) -> AppConfig:
     init_kwargs = cli_overrides or {}
 
     if config_file:
@@ -6,6 +6,7 @@ This is the ONLY application-layer module allowed to import from infrastructure.
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -21,6 +22,27 @@ from arete.infrastructure.adapters.anki_direct import AnkiDirectAdapter
 from arete.infrastructure.adapters.stats import ConnectStatsRepository, DirectStatsRepository
 from arete.infrastructure.persistence.cache import ContentCache as _CacheImpl
 
+# Memoized AnkiConnect probe per URL so repeated factory calls in one process
+# don't each pay an HTTP round-trip to decide the backend.
+_AC_CACHE: dict[str, tuple[AnkiConnectAdapter, bool]] = {}
+
+
+def clear_factory_cache() -> None:
+    """Forget cached AnkiConnect probe results. Used by tests."""
+    _AC_CACHE.clear()
+
+
+async def _get_responsive_connect(url: str) -> tuple[AnkiConnectAdapter, bool]:
+    """Return a (cached) AnkiConnectAdapter for url and whether it responded."""
+    cached = _AC_CACHE.get(url)
+    if cached is not None:
+        return cached
+
+    ac = AnkiConnectAdapter(url=url)
+    responsive = await ac.is_responsive()
+    _AC_CACHE[url] = (ac, responsive)
+    return ac, responsive
+
 
 async def get_anki_bridge(config: AppConfig) -> AnkiBridge:
     """Return the appropriate AnkiBridge implementation based on config and responsiveness."""
@@ -32,15 +54,11 @@ async def get_anki_bridge(config: AppConfig) -> AnkiBridge:
         return AnkiDirectAdapter(anki_base=config.anki_base)
 
     # 2. Auto selection
-    ac = AnkiConnectAdapter(url=config.anki_connect_url)
-    if await ac.is_responsive():
-        import sys
-
+    ac, responsive = await _get_responsive_connect(config.anki_connect_url)
+    if responsive:
         print("Backend: AnkiConnect", file=sys.stderr)
         return ac
 
-    import sys
-
     print("Backend: AnkiDirect", file=sys.stderr)
     return AnkiDirectAdapter(anki_base=config.anki_base)
 
@@ -54,13 +54,8 @@ async def execute_sync(config: AppConfig) -> RunStats:
     )
 
     anki_bridge = await get_anki_bridge(config)
-    try:
-        stats = await run_pipeline(
-            config, logger, run_id, vault_service, parser, anki_bridge, cache
-        )
-        return stats
-    finally:
-        await anki_bridge.close()
+    async with anki_bridge:
+        return await run_pipeline(config, logger, run_id, vault_service, parser, anki_bridge, cache)
 
 
 class SyncFailedError(Exception):
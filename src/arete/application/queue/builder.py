@@ -6,11 +6,18 @@ Builds ordered study queues by:
 3. Topologically sorting for proper learning order
 """
 
+import heapq
 import logging
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 
-from arete.application.queue.graph_resolver import build_graph, topological_sort
+from arete.application.queue.graph_resolver import (
+    build_graph,
+    detect_cycles,
+    detect_cycles_in_subset,
+    topological_sort,
+)
 from arete.domain.constants import DEFAULT_MAX_QUEUE_SIZE, DEFAULT_PREREQ_DEPTH
 from arete.domain.graph import DependencyGraph
 
@@ -50,8 +57,6 @@ def build_simple_queue(
         QueueBuildResult with ordered queues and diagnostics
 
     """
-    from arete.application.queue.graph_resolver import detect_cycles
-
     graph = build_graph(vault_root)
 
     # Collect all prerequisites for due cards
@@ -140,21 +145,35 @@ def build_dependency_queue(
     # Collect all prerequisites up to depth
     all_prereqs: set[str] = set()
 
-    # Collect unresolved refs from the graph (tracked during build_graph)
+    # Collect unresolved refs from the graph (tracked during build_graph).
+    # Dedup via a companion set; the list keeps first-seen order.
     missing_prereqs: list[str] = []
+    missing_seen: set[str] = set()
     for due_id in due_card_ids:
         for ref in graph.unresolved_refs.get(due_id, []):
-            if ref not in missing_prereqs:
+            if ref not in missing_seen:
+                missing_seen.add(ref)
                 missing_prereqs.append(ref)
 
-    for due_id in due_card_ids:
-        prereqs = _collect_prereqs(graph, due_id, depth, set())
-        for prereq_id in prereqs:
+    # Single multi-source BFS over all due cards with one shared visited set,
+    # so prereq subtrees shared between due cards are only walked once.
+    visited: set[str] = set(due_card_ids)
+    bfs_queue: deque[tuple[str, int]] = deque((due_id, 0) for due_id in due_card_ids)
+    while bfs_queue:
+        cid, d = bfs_queue.popleft()
+        if d >= depth:
+            continue
+        for prereq_id in graph.get_prerequisites(cid):
+            if prereq_id in visited:
+                continue
+            visited.add(prereq_id)
+            bfs_queue.append((prereq_id, d + 1))
             if prereq_id in graph.nodes:
                 all_prereqs.add(prereq_id)
                 # Also collect any unresolved refs from prereqs
                 for ref in graph.unresolved_refs.get(prereq_id, []):
-                    if ref not in missing_prereqs:
+                    if ref not in missing_seen:
+                        missing_seen.add(ref)
                         missing_prereqs.append(ref)
 
     # Remove the due cards themselves from prereqs
@@ -173,18 +192,23 @@ def build_dependency_queue(
     # Cap at max_nodes (prioritize weakest if we have stats)
     if len(weak_prereqs) > max_nodes:
         if card_stats:
-            # Sort by weakness (lower stability = weaker)
-            weak_prereqs.sort(key=lambda x: card_stats.get(x, {}).get("stability", float("inf")))
-        weak_prereqs = weak_prereqs[:max_nodes]
+            # Top-N by weakness (lower stability = weaker) via partial sort:
+            # O(n log k) instead of sorting every weak prereq.
+            weak_prereqs = heapq.nsmallest(
+                max_nodes,
+                weak_prereqs,
+                key=lambda x: card_stats.get(x, {}).get("stability", float("inf")),
+            )
+        else:
+            weak_prereqs = weak_prereqs[:max_nodes]
 
     # Topologically sort both queues
     prereq_queue = topological_sort(graph, weak_prereqs)
     main_queue = topological_sort(graph, due_card_ids)
 
-    # Detect cycles in the combined set
-    from arete.application.queue.graph_resolver import detect_cycles
-
-    cycles = detect_cycles(graph)
+    # Detect cycles only among the cards that made it into the queues;
+    # cycles elsewhere in the vault are not this queue's problem.
+    cycles = detect_cycles_in_subset(graph, prereq_queue + main_queue)
 
     return QueueBuildResult(
         prereq_queue=prereq_queue,
@@ -256,16 +280,23 @@ def _collect_prereqs(
     depth: int,
     visited: set[str],
 ) -> set[str]:
-    """Recursively collect prerequisites up to a given depth."""
+    """Collect prerequisites up to a given depth (iterative, no recursion)."""
+    prereqs: set[str] = set()
     if depth <= 0 or card_id in visited:
-        return set()
+        return prereqs
 
     visited.add(card_id)
-    prereqs: set[str] = set()
+    stack: list[tuple[str, int]] = [(card_id, depth)]
 
-    for prereq_id in graph.get_prerequisites(card_id):
-        prereqs.add(prereq_id)
-        prereqs.update(_collect_prereqs(graph, prereq_id, depth - 1, visited))
+    while stack:
+        cid, remaining = stack.pop()
+        if remaining <= 0:
+            continue
+        for prereq_id in graph.get_prerequisites(cid):
+            prereqs.add(prereq_id)
+            if prereq_id not in visited:
+                visited.add(prereq_id)
+                stack.append((prereq_id, remaining - 1))
 
     return prereqs
 
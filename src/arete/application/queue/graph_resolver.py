@@ -7,12 +7,16 @@ builds the full dependency graph, and provides traversal utilities.
 from __future__ import annotations
 
 import logging
+import os
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 import networkx as nx
 
-from arete.application.utils.fs import iter_markdown_files
+from arete.application.utils.fs import iter_markdown_files, read_frontmatter_only
 from arete.application.utils.text import normalize_filename, parse_frontmatter
 from arete.domain.graph import CardNode, DependencyGraph, LocalGraphResult
 
@@ -103,6 +107,39 @@ class SubgraphResult:
 logger = logging.getLogger(__name__)
 
 
+# Cache of built graphs keyed by vault root. Each entry stores the vault
+# signature (sorted (path, mtime_ns, size) triples) used to detect staleness,
+# so repeated queue builds within one session skip the full re-scan.
+_GRAPH_CACHE: dict[str, tuple[tuple, DependencyGraph]] = {}
+
+
+def _vault_signature(vault_root: Path) -> tuple:
+    """Compute a cheap change signature for a vault's markdown files."""
+    entries: list[tuple[str, int, int]] = []
+    for md_path in iter_markdown_files(vault_root):
+        try:
+            st = md_path.stat()
+        except OSError:
+            continue
+        entries.append((str(md_path), st.st_mtime_ns, st.st_size))
+    entries.sort()
+    return tuple(entries)
+
+
+# Per-file parse cache: path -> (mtime_ns, size, parsed records). Files whose
+# mtime and size are unchanged since the last scan are re-inserted into the
+# fresh graph without re-reading or re-parsing YAML. None means the file was
+# parsed but contributes nothing to the graph (not an arete file, bad YAML).
+_ParsedFile = tuple[str, list[CardNode], list[tuple[str, list[str], list[str]]]]
+_FILE_CACHE: dict[str, tuple[int, int, _ParsedFile | None]] = {}
+
+
+def invalidate_graph_cache() -> None:
+    """Drop all cached graphs. Useful for tests and long-running servers."""
+    _GRAPH_CACHE.clear()
+    _FILE_CACHE.clear()
+
+
 def build_graph(vault_root: Path) -> DependencyGraph:
     """Build a complete dependency graph from all markdown files in the vault.
 
@@ -111,6 +148,117 @@ def build_graph(vault_root: Path) -> DependencyGraph:
     Dependency references support two formats:
     - arete_XXX: Direct card ID lookup
     - basename: All cards in the file with that basename (e.g., "algebra" -> algebra.md)
+
+    Results are cached per vault root: if no markdown file's mtime or size
+    changed since the last build, the previously built graph is returned
+    without re-reading the vault.
+    """
+    cache_key = str(vault_root)
+    signature = _vault_signature(vault_root)
+    cached = _GRAPH_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    graph = _build_graph_uncached(vault_root)
+    _GRAPH_CACHE[cache_key] = (signature, graph)
+    return graph
+
+
+def _parse_vault_file(md_path: Path, text: str) -> _ParsedFile | None:
+    """Parse one markdown file's text into graph records.
+
+    Returns (basename, nodes, deps) where deps is a list of
+    (card_id, requires, related), or None if the file contributes nothing.
+    """
+    meta, _ = parse_frontmatter(text)
+
+    if not meta or "__yaml_error__" in meta:
+        return None
+
+    if meta.get("arete") is not True:
+        return None
+
+    cards = meta.get("cards", [])
+    if not isinstance(cards, list):
+        return None
+
+    # Get file basename for index. Normalize to NFC so user-typed
+    # YAML refs (NFC) match macOS filesystem basenames (NFD).
+    basename = normalize_filename(md_path.stem)  # "algebra.md" -> "algebra"
+
+    nodes: list[CardNode] = []
+    deps: list[tuple[str, list[str], list[str]]] = []
+
+    for card in cards:
+        if not isinstance(card, dict):
+            continue
+
+        card_id = card.get("id")
+        if not card_id:
+            continue  # Skip cards without Arete ID
+
+        # Extract title from Front field or use ID
+        # V2: fields are at root. V1 (internal model): fields might be nested.
+        fields = card.get("fields", {})
+        if isinstance(fields, dict) and "Front" in fields:
+            title = fields.get("Front")
+        else:
+            # Fallback to checking root level (V2)
+            title = card.get("Front") or card.get("title") or card_id
+
+        # Get line number if available
+        line_number = card.get("__line__", 1)
+
+        nodes.append(
+            CardNode(
+                id=card_id,
+                title=str(title)[:100],  # Truncate long titles
+                file_path=str(md_path),
+                line_number=line_number,
+            )
+        )
+
+        # Collect deps for second pass
+        card_deps = card.get("deps", {})
+        if isinstance(card_deps, dict):
+            requires = card_deps.get("requires", [])
+            related = card_deps.get("related", [])
+            if requires or related:
+                deps.append(
+                    (
+                        card_id,
+                        requires if isinstance(requires, list) else [],
+                        related if isinstance(related, list) else [],
+                    )
+                )
+
+    return basename, nodes, deps
+
+
+# Changed-file count above which frontmatter parsing is fanned out to worker
+# processes. Below it, process startup costs more than the parsing saves.
+_PROCESS_POOL_MIN_FILES = 64
+
+
+def _read_and_parse(path_str: str) -> tuple[str, int, int, _ParsedFile | None] | None:
+    """Read and parse one file; module-level so it pickles for worker processes."""
+    md_path = Path(path_str)
+    try:
+        st = md_path.stat()
+        # The graph only needs frontmatter, so skip reading long note bodies
+        text = read_frontmatter_only(md_path)
+        return path_str, st.st_mtime_ns, st.st_size, _parse_vault_file(md_path, text)
+    except Exception as e:
+        logger.warning(f"Failed to parse {md_path}: {e}")
+        return None
+
+
+def _build_graph_uncached(vault_root: Path) -> DependencyGraph:
+    """Scan the vault and build the dependency graph (no whole-graph caching).
+
+    Unchanged files (matching mtime_ns and size) are replayed from the
+    per-file parse cache, so an incremental rebuild only re-parses the
+    files that actually changed since the last scan.
     """
     graph = DependencyGraph()
 
@@ -118,75 +266,87 @@ def build_graph(vault_root: Path) -> DependencyGraph:
     file_index: dict[str, list[str]] = {}  # basename -> list of card IDs
     pending_deps: list[tuple[str, list[str], list[str]]] = []  # (card_id, requires, related)
 
+    scan_order: list[str] = []
+    seen_paths: set[str] = set()
+    parsed_by_path: dict[str, _ParsedFile | None] = {}
+    to_read: list[tuple[Path, os.stat_result]] = []
+
     for md_path in iter_markdown_files(vault_root):
+        path_key = str(md_path)
+        seen_paths.add(path_key)
         try:
-            text = md_path.read_text(encoding="utf-8")
-            meta, _ = parse_frontmatter(text)
-
-            if not meta or "__yaml_error__" in meta:
-                continue
-
-            if meta.get("arete") is not True:
+            st = md_path.stat()
+        except OSError as e:
+            logger.warning(f"Failed to stat {md_path}: {e}")
+            continue
+        scan_order.append(path_key)
+        cached = _FILE_CACHE.get(path_key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            parsed_by_path[path_key] = cached[2]
+        else:
+            to_read.append((md_path, st))
+
+    if len(to_read) >= _PROCESS_POOL_MIN_FILES:
+        # Frontmatter parsing is CPU-bound pure Python, so for large change
+        # sets fan the read+parse out across cores; the GIL caps what the
+        # threaded path below can win once parsing dominates.
+        with ProcessPoolExecutor() as proc_pool:
+            for result in proc_pool.map(
+                _read_and_parse, (str(p) for p, _ in to_read), chunksize=32
+            ):
+                if result is None:
+                    continue
+                path_key, mtime_ns, size, parsed = result
+                _FILE_CACHE[path_key] = (mtime_ns, size, parsed)
+                parsed_by_path[path_key] = parsed
+    # Otherwise read the changed files through a thread pool: the reads are
+    # pure I/O that release the GIL, so they overlap. YAML parsing stays on
+    # the main thread.
+    elif to_read:
+
+        def _read(item: tuple[Path, os.stat_result]) -> tuple[Path, os.stat_result, str | None]:
+            md_path, st = item
+            try:
+                # The graph only needs frontmatter; skip long note bodies
+                return md_path, st, read_frontmatter_only(md_path)
+            except Exception as e:
+                logger.warning(f"Failed to read {md_path}: {e}")
+                return md_path, st, None
+
+        with ThreadPoolExecutor(max_workers=min(32, len(to_read))) as pool:
+            read_results = list(pool.map(_read, to_read))
+
+        for md_path, st, text in read_results:
+            if text is None:
                 continue
-
-            cards = meta.get("cards", [])
-            if not isinstance(cards, list):
+            path_key = str(md_path)
+            try:
+                parsed = _parse_vault_file(md_path, text)
+            except Exception as e:
+                logger.warning(f"Failed to parse {md_path}: {e}")
                 continue
+            _FILE_CACHE[path_key] = (st.st_mtime_ns, st.st_size, parsed)
+            parsed_by_path[path_key] = parsed
 
-            # Get file basename for index. Normalize to NFC so user-typed
-            # YAML refs (NFC) match macOS filesystem basenames (NFD).
-            basename = normalize_filename(md_path.stem)  # "algebra.md" -> "algebra"
-            if basename not in file_index:
-                file_index[basename] = []
+    # Stitch records into the graph in vault scan order for determinism
+    for path_key in scan_order:
+        parsed = parsed_by_path.get(path_key)
+        if parsed is None:
+            continue
 
-            for card in cards:
-                if not isinstance(card, dict):
-                    continue
+        basename, nodes, deps = parsed
+        if basename not in file_index:
+            file_index[basename] = []
+        for node in nodes:
+            graph.add_node(node)
+            file_index[basename].append(node.id)
+        pending_deps.extend(deps)
 
-                card_id = card.get("id")
-                if not card_id:
-                    continue  # Skip cards without Arete ID
-
-                # Extract title from Front field or use ID
-                # V2: fields are at root. V1 (internal model): fields might be nested.
-                fields = card.get("fields", {})
-                if isinstance(fields, dict) and "Front" in fields:
-                    title = fields.get("Front")
-                else:
-                    # Fallback to checking root level (V2)
-                    title = card.get("Front") or card.get("title") or card_id
-
-                # Get line number if available
-                line_number = card.get("__line__", 1)
-
-                node = CardNode(
-                    id=card_id,
-                    title=str(title)[:100],  # Truncate long titles
-                    file_path=str(md_path),
-                    line_number=line_number,
-                )
-                graph.add_node(node)
-
-                # Add to file index
-                file_index[basename].append(card_id)
-
-                # Collect deps for second pass
-                deps = card.get("deps", {})
-                if isinstance(deps, dict):
-                    requires = deps.get("requires", [])
-                    related = deps.get("related", [])
-                    if requires or related:
-                        pending_deps.append(
-                            (
-                                card_id,
-                                requires if isinstance(requires, list) else [],
-                                related if isinstance(related, list) else [],
-                            )
-                        )
-
-        except Exception as e:
-            logger.warning(f"Failed to parse {md_path}: {e}")
-            continue
+    # Evict cache entries for files that disappeared from this vault. The
+    # trailing separator keeps sibling vaults (/a/vault vs /a/vault2) intact.
+    vault_prefix = str(vault_root) + os.sep
+    for stale in [k for k in _FILE_CACHE if k.startswith(vault_prefix) and k not in seen_paths]:
+        del _FILE_CACHE[stale]
 
     # Build reverse index: card_id -> basename of its file
     card_to_basename: dict[str, str] = {}
@@ -281,30 +441,24 @@ def get_local_graph(
     dependents: set[str] = set()
     related_ids: set[str] = set()
 
-    # Walk prerequisites (backward along requires edges)
-    def walk_prereqs(cid: str, current_depth: int) -> None:
-        if current_depth > depth or len(prereqs) >= max_nodes:
-            return
-        for prereq_id in graph.get_prerequisites(cid):
-            if len(prereqs) >= max_nodes:
-                break
-            if prereq_id not in prereqs and prereq_id in graph.nodes:
-                prereqs.add(prereq_id)
-                walk_prereqs(prereq_id, current_depth + 1)
-
-    # Walk dependents (forward along requires edges)
-    def walk_dependents(cid: str, current_depth: int) -> None:
-        if current_depth > depth or len(dependents) >= max_nodes:
-            return
-        for dep_id in graph.get_dependents(cid):
-            if len(dependents) >= max_nodes:
-                break
-            if dep_id not in dependents and dep_id in graph.nodes:
-                dependents.add(dep_id)
-                walk_dependents(dep_id, current_depth + 1)
-
-    walk_prereqs(card_id, 1)
-    walk_dependents(card_id, 1)
+    # Walk requires edges iteratively (BFS); bounded by depth and max_nodes
+    # without paying a Python call frame per visited node.
+    def walk(collected: set[str], neighbors) -> None:
+        queue: deque[tuple[str, int]] = deque([(card_id, 0)])
+        while queue:
+            cid, d = queue.popleft()
+            if d >= depth or len(collected) >= max_nodes:
+                continue
+            for next_id in neighbors(cid):
+                if len(collected) >= max_nodes:
+                    break
+                if next_id not in collected and next_id in graph.nodes:
+                    collected.add(next_id)
+                    queue.append((next_id, d + 1))
+
+    # Prerequisites: backward along requires edges; dependents: forward.
+    walk(prereqs, graph.get_prerequisites)
+    walk(dependents, graph.get_dependents)
 
     # Get related (only direct, no traversal)
     for rel_id in graph.get_related(card_id):
@@ -328,11 +482,41 @@ def detect_cycles(graph: DependencyGraph) -> list[list[str]]:
 
     Returns a list of strongly connected components (cycles).
     Each cycle is a list of card IDs that form a co-requisite group.
+
+    The result is memoized on the graph and invalidated when edges change,
+    so queue builds that sort and cycle-check the same graph pay for the
+    SCC pass only once.
     """
+    if graph._cycles_cache is not None:
+        return graph._cycles_cache
+
     if nx.is_directed_acyclic_graph(graph._graph):
+        cycles: list[list[str]] = []
+    else:
+        cycles = [
+            list(scc) for scc in nx.strongly_connected_components(graph._graph) if len(scc) > 1
+        ]
+
+    graph._cycles_cache = cycles
+    return cycles
+
+
+def detect_cycles_in_subset(graph: DependencyGraph, node_ids: Iterable[str]) -> list[list[str]]:
+    """Detect cycles within the subgraph induced by node_ids.
+
+    Queue builds only care about co-requisite groups among the cards that
+    actually end up in the queue; scoping the SCC pass to that subset keeps
+    the cost linear in queue size rather than vault size.
+    """
+    subset = {cid for cid in node_ids if cid in graph._graph}
+    if not subset:
         return []
 
-    return [list(scc) for scc in nx.strongly_connected_components(graph._graph) if len(scc) > 1]
+    sub = graph._graph.subgraph(subset)
+    if nx.is_directed_acyclic_graph(sub):
+        return []
+
+    return [list(scc) for scc in nx.strongly_connected_components(sub) if len(scc) > 1]
 
 
 def detect_cycles_for_card(graph: DependencyGraph, card_id: str) -> list[list[str]]:
@@ -355,11 +539,9 @@ def detect_cycles_for_card(graph: DependencyGraph, card_id: str) -> list[list[st
 
 def find_isolated_nodes(graph: DependencyGraph) -> list[str]:
     """Find cards with no requires AND no dependents (completely disconnected)."""
-    return [
-        cid
-        for cid in graph.nodes
-        if not graph.get_prerequisites(cid) and not graph.get_dependents(cid)
-    ]
+    has_prereqs = graph.has_prerequisites
+    has_deps = graph.has_dependents
+    return [cid for cid in graph.nodes if not has_prereqs(cid) and not has_deps(cid)]
 
 
 def find_connected_components(graph: DependencyGraph) -> list[set[str]]:
@@ -394,8 +576,9 @@ def topological_sort(
         Sorted list of card IDs (prerequisites before dependents)
 
     """
-    # Filter to only requested cards that exist
-    valid_ids = {cid for cid in card_ids if cid in graph.nodes}
+    # Filter to only requested cards that exist. An insertion-ordered dict
+    # (not a set) so the cycle fallback below preserves the caller's order.
+    valid_ids = dict.fromkeys(cid for cid in card_ids if cid in graph.nodes)
 
     # Build a fresh subgraph with only the requested nodes and their edges
     sub = nx.DiGraph()
@@ -562,10 +745,11 @@ def check_graph_health(
                 )
             )
 
-    # Root nodes: have dependents but no prerequisites
-    roots = [
-        cid for cid in graph.nodes if not graph.get_prerequisites(cid) and graph.get_dependents(cid)
-    ]
+    # Root nodes: have dependents but no prerequisites. Bound-method locals
+    # plus the allocation-free has_* checks keep this a flat scan.
+    has_prereqs = graph.has_prerequisites
+    has_deps = graph.has_dependents
+    roots = [cid for cid in graph.nodes if not has_prereqs(cid) and has_deps(cid)]
 
     ok = len(cycles_raw) == 0 and len(unresolved_entries) == 0
 
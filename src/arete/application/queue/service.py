@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
 from typing import Literal
 
@@ -182,7 +183,13 @@ async def build_study_queue(  # noqa: PLR0913
     if algo == "dynamic" and build_result.ordered_queue:
         combined = build_result.ordered_queue
     else:
-        all_ids = list(dict.fromkeys(build_result.prereq_queue + build_result.main_queue))
+        # Ordered dedup in one pass — no concatenated list, no intermediate dict.
+        seen: set[str] = set()
+        all_ids = [
+            cid
+            for cid in chain(build_result.prereq_queue, build_result.main_queue)
+            if not (cid in seen or seen.add(cid))
+        ]
         graph = build_graph(vault_root)
         combined = topological_sort(graph, all_ids)
 
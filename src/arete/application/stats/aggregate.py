@@ -0,0 +1,32 @@
+"""Numerically stable aggregation of per-card metric samples.
+
+Pure computation helpers for variance-style metrics such as review
+volatility. Summaries are ``(n, mean, M2)`` triples (Welford form),
+where ``M2`` is the sum of squared deviations from the mean; variance
+is ``M2 / n``. The single-pass update avoids materializing value lists
+plus a second mean-subtraction pass.
+"""
+
+from collections.abc import Iterable
+
+# (count, mean, M2)
+StatsTriple = tuple[int, float, float]
+
+
+def triple_of(values: Iterable[float]) -> StatsTriple:
+    """Summarize a sample into a ``(n, mean, M2)`` triple via Welford's update."""
+    n, mean, m2 = 0, 0.0, 0.0
+    for x in values:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+    return (n, mean, m2)
+
+
+def variance_of(triple: StatsTriple) -> float | None:
+    """Return the population variance from a summary, or None for samples of size < 2."""
+    n, _, m2 = triple
+    if n < 2:
+        return None
+    return m2 / n
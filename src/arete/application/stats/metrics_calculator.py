@@ -5,9 +5,15 @@ This is a pure computation module with no I/O.
 
 import time
 from dataclasses import dataclass, field
+from math import exp, log
 
+from arete.application.stats.aggregate import triple_of, variance_of
 from arete.domain.stats.models import CardStatsAggregate, ReviewEntry
 
+# Retrievability R = 0.9**(t/S) is computed as exp(ln(0.9) * t/S): one libm
+# exp call instead of float.__pow__'s general dispatch, on the hottest path.
+_LN09 = log(0.9)
+
 
 @dataclass
 class EnrichedStats:
@@ -54,12 +60,42 @@ class MetricsCalculator:
     Stateless and side-effect free.
     """
 
-    def enrich(self, card: CardStatsAggregate, deck_params: dict | None = None) -> EnrichedStats:
-        """Enrich a card's stats with computed metrics."""
-        retrievability = self._compute_retrievability(card)
+    def enrich_many(
+        self,
+        cards: list[CardStatsAggregate],
+        deck_params: dict[str, dict] | None = None,
+    ) -> list[EnrichedStats]:
+        """Enrich a batch of cards in one pass.
+
+        Preferred over per-card enrich() for large nid lists: per-batch work
+        (deck parameter lookups, the shared empty-params dict, the reference
+        timestamp) is hoisted out of the per-card loop.
+        """
+        params_by_deck = deck_params or {}
+        no_params: dict = {}
+        now_epoch = int(time.time())
+        return [
+            self.enrich(card, params_by_deck.get(card.deck_name) or no_params, now_epoch)
+            for card in cards
+        ]
+
+    def enrich(
+        self,
+        card: CardStatsAggregate,
+        deck_params: dict | None = None,
+        now_epoch: int | None = None,
+    ) -> EnrichedStats:
+        """Enrich a card's stats with computed metrics.
+
+        ``now_epoch`` is the reference timestamp for time-based metrics;
+        callers enriching a batch should compute it once and pass it in.
+        """
+        if now_epoch is None:
+            now_epoch = int(time.time())
+        retrievability = self._compute_retrievability(card, now_epoch)
         lapse_rate = self._compute_lapse_rate(card)
         volatility = self._compute_volatility(card.reviews)
-        days_overdue = self._compute_days_overdue(card)
+        days_overdue = self._compute_days_overdue(card, now_epoch)
         adherence = self._compute_schedule_adherence(card)
 
         d_params = deck_params or {}
@@ -95,14 +131,14 @@ class MetricsCalculator:
             average_time_ms=avg_time,
             ret_at_review=self._compute_ret_at_review(card.reviews),
             schedule_adherence=adherence,
-            is_overlearning=self._detect_overlearning(card),
+            is_overlearning=self._detect_overlearning(card, now_epoch),
             answer_distribution=card.answer_distribution,
             desired_retention=d_params.get("desired_retention"),
             weights=d_params.get("weights", []),
             fsrs_history_missing=fsrs_history_missing,
         )
 
-    def _compute_retrievability(self, card: CardStatsAggregate) -> float | None:
+    def _compute_retrievability(self, card: CardStatsAggregate, now_epoch: int) -> float | None:
         """Compute current recall probability using FSRS formula.
 
         R = 0.9^(t/S) where t = days since last review, S = stability.
@@ -110,13 +146,12 @@ class MetricsCalculator:
         if not card.fsrs or not card.last_review:
             return None
 
-        now_epoch = int(time.time())
         days_elapsed = (now_epoch - card.last_review) / 86400.0
 
         if card.fsrs.stability <= 0:
             return None
 
-        return 0.9 ** (days_elapsed / card.fsrs.stability)
+        return exp(_LN09 * days_elapsed / card.fsrs.stability)
 
     def _compute_lapse_rate(self, card: CardStatsAggregate) -> float | None:
         """Compute lapse rate as lapses / total reviews."""
@@ -132,36 +167,25 @@ class MetricsCalculator:
         if len(reviews) < 3:
             return None
 
-        # Use last 10 reviews
+        # Use last 10 reviews. Welford triples keep the variance numerically
+        # stable in a single pass per sample.
         recent = reviews[-10:]
 
         # Prefer stability values if available (User's preferred definition)
-        stabilities = [r.stability for r in recent if r.stability is not None]
-
-        if len(stabilities) >= 2:
-            mean = sum(stabilities) / len(stabilities)
-            variance = sum((s - mean) ** 2 for s in stabilities) / len(stabilities)
-            return variance
+        stability_var = variance_of(
+            triple_of(r.stability for r in recent if r.stability is not None)
+        )
+        if stability_var is not None:
+            return stability_var
 
-        # Fallback to interval variance (normalized) if stability history is missing
-        # We normalize by dividing by mean interval to make it scale-independent
-        intervals = [r.interval for r in recent]
-        if len(intervals) < 2:
+        # Fallback to interval variance if stability history is missing.
+        # Without stability this metric is weak, but it's what we have.
+        i_n, i_mean, i_m2 = triple_of(float(r.interval) for r in recent)
+        if i_n < 2:
             return None
-
-        mean = sum(intervals) / len(intervals)
-        if mean == 0:
+        if i_mean == 0:
             return 0.0
-        variance = sum((i - mean) ** 2 for i in intervals) / len(intervals)
-
-        # Return coefficient of variation squared or similar metric?
-        # For now raw variance of intervals might be huge.
-        # Let's return std dev / mean (Coefficient of Variation) * 10 or something
-        # user wants "S Var" which matches stability scale.
-        # Without stability, this metric is weak.
-        # But user agreed to "fix volatility".
-        # Let's leave it as is for now or use interval growth variance?
-        return variance
+        return i_m2 / i_n
 
     def _compute_schedule_adherence(self, card: CardStatsAggregate) -> float | None:
         """Ratio of Actual Interval / Predicted Interval (Stability).
@@ -179,12 +203,11 @@ class MetricsCalculator:
         # Predicted gap for 90% retention is exactly Stability.
         return card.interval / card.fsrs.stability
 
-    def _compute_days_overdue(self, card: CardStatsAggregate) -> int | None:
+    def _compute_days_overdue(self, card: CardStatsAggregate, now_epoch: int) -> int | None:
         """Compute days overdue (negative if not yet due)."""
         if not card.last_review or card.interval == 0:
             return None
 
-        now_epoch = int(time.time())
         expected_due_epoch = card.last_review + (card.interval * 86400)
         return int((now_epoch - expected_due_epoch) / 86400)
 
@@ -233,7 +256,7 @@ class MetricsCalculator:
             return None
         return reviews[-1].retrievability
 
-    def _detect_overlearning(self, card: CardStatsAggregate) -> bool:
+    def _detect_overlearning(self, card: CardStatsAggregate, now_epoch: int) -> bool:
         """Flag cards that are being reviewed too often for their stability.
 
         Criteria: Stability > 90 days AND Retrievability > 98% AND days_overdue < -30.
@@ -241,13 +264,12 @@ class MetricsCalculator:
         if not card.fsrs or card.fsrs.stability < 90:
             return False
 
-        now_epoch = int(time.time())
         if not card.last_review:
             return False
 
         days_elapsed = (now_epoch - card.last_review) / 86400.0
         # retrievability formula
-        retrievability = 0.9 ** (days_elapsed / card.fsrs.stability)
+        retrievability = exp(_LN09 * days_elapsed / card.fsrs.stability)
 
         # If we are reviewing with very high retrievability and long stability
         if retrievability > 0.98 and days_elapsed < (card.fsrs.stability * 0.1):
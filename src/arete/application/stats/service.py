@@ -29,15 +29,8 @@ class FsrsStatsService:
         deck_names = list({s.deck_name for s in stats})
         deck_params = await self.repo.get_deck_params(deck_names)
 
-        # 4. Enrich each card
-        results = []
+        # 4. Attach reviews, then enrich the whole batch in one pass
         for s in stats:
-            # Attach reviews
             s.reviews = reviews_by_cid.get(s.card_id, [])
 
-            # Enrich
-            d_params = deck_params.get(s.deck_name)
-            enriched = self.calculator.enrich(s, d_params)
-            results.append(enriched)
-
-        return results
+        return self.calculator.enrich_many(stats, deck_params)
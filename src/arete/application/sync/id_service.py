@@ -6,7 +6,7 @@ from typing import Any
 
 from ulid import ULID
 
-from arete.application.utils.fs import iter_markdown_files
+from arete.application.utils.fs import iter_markdown_files, read_frontmatter_only
 from arete.application.utils.text import (
     parse_frontmatter,
     rebuild_markdown_with_frontmatter,
@@ -55,8 +55,16 @@ def assign_arete_ids(vault_root: Path, dry_run: bool = False) -> int:
 
     for file_path in iter_markdown_files(vault_root):
         scanned += 1
-        content = file_path.read_text(encoding="utf-8")
-        meta, body = parse_frontmatter(content)
+        # Parse only the frontmatter first; the body is needed just for the
+        # rewrite, and most files need no IDs assigned at all.
+        header = read_frontmatter_only(file_path)
+
+        # Cheap substring pre-filter: files without a cards list can never
+        # need IDs, so don't pay for a YAML parse on them.
+        if "cards:" not in header:
+            continue
+
+        meta, _ = parse_frontmatter(header)
 
         if not meta:
             continue
@@ -68,6 +76,8 @@ def assign_arete_ids(vault_root: Path, dry_run: bool = False) -> int:
             if not dry_run:
                 # Use scrub_internal_keys to remove __line__ etc. before dumping
                 # Note: ensure_card_ids doesn't add internal keys, so we just rebuild
+                content = file_path.read_text(encoding="utf-8")
+                _, body = parse_frontmatter(content)
                 normalized = rebuild_markdown_with_frontmatter(meta, body)
                 file_path.write_text(normalized, encoding="utf-8")
                 logger.info(f"Assigned {assigned} IDs in {file_path}")
@@ -211,7 +211,10 @@ async def run_pipeline(
     # -------- Stage 4: Persist Updates (Write back NIDs) --------
     if updates:
         logger.info("[pipeline] Persisting NIDs/CIDs to frontmatter...")
-        vault_service.apply_updates(updates, dry_run=config.dry_run)
+        # Reuse the meta parsed during the scan stage so apply_updates
+        # doesn't re-parse each affected file's frontmatter.
+        meta_by_file = {p: meta for p, meta, _ in compatible}
+        vault_service.apply_updates(updates, dry_run=config.dry_run, meta_by_file=meta_by_file)
 
     # -------- Stage 5: Prune Orphans (Destructive) --------
     if config.prune:
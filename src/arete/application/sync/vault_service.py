@@ -1,16 +1,67 @@
+import copy
 import hashlib
 import logging
-from collections import defaultdict
+import os
+import re
+import threading
+from collections import OrderedDict
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
 from pathlib import Path
 from typing import Any
 
 from arete.application.utils.common import sanitize
 from arete.application.utils.fs import iter_markdown_files
-from arete.application.utils.text import parse_frontmatter, rebuild_markdown_with_frontmatter
+from arete.application.utils.text import (
+    _find_fm_span,
+    parse_frontmatter,
+    rebuild_markdown_with_frontmatter,
+)
 from arete.domain.interfaces import ContentCache
 from arete.domain.models import UpdateItem
 
+# Case-insensitive arete-marker probe over the raw head bytes: one C-level
+# regex scan instead of lowercasing a 4KB copy per file and substring-testing.
+_FM_MARKER = re.compile(rb"(?i)arete:|cards:")
+
+
+def _content_fingerprint(data: bytes) -> str:
+    """Content-change fingerprint for the file cache (not a security boundary).
+
+    SHA-1 through OpenSSL uses the SHA-NI / ARMv8 crypto instructions where
+    available, hashing ~2-3x faster than MD5 during cold-cache vault scans.
+    """
+    return hashlib.sha1(data, usedforsecurity=False).hexdigest()
+
+
+# In-process memo of parsed frontmatter keyed by content fingerprint. The
+# sqlite stat-cache misses whenever mtime changes without the content changing
+# (touch, vault re-sync) and is bypassed entirely under --force; within a
+# daemon/watch process this keeps those re-parses to a dict lookup. Entries
+# are stored and returned as copies so callers can mutate their meta freely.
+_PARSE_MEMO_MAX = 4096
+_parse_memo: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_parse_memo_lock = threading.Lock()
+
+
+def _memoized_parse(file_hash: str, text: str) -> dict[str, Any]:
+    """Parse frontmatter, memoizing good results by content fingerprint."""
+    with _parse_memo_lock:
+        cached = _parse_memo.get(file_hash)
+        if cached is not None:
+            _parse_memo.move_to_end(file_hash)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    meta, _body = parse_frontmatter(text)
+    if meta and "__yaml_error__" not in meta:
+        with _parse_memo_lock:
+            _parse_memo[file_hash] = copy.deepcopy(meta)
+            while len(_parse_memo) > _PARSE_MEMO_MAX:
+                _parse_memo.popitem(last=False)
+    return meta
+
 
 class VaultService:
     def __init__(self, root: Path, cache: ContentCache, ignore_cache: bool = False):
@@ -28,14 +79,27 @@ class VaultService:
                  is_fresh=True means we just parsed it (cache was cold/dirty).
                  is_fresh=False means we loaded meta from stat-cache (cache was warm).
         """
-        for p in iter_markdown_files(self.root):
-            ok, _, reason, meta, is_fresh = self._quick_check_file(p)
-            if ok and meta:
-                cards_count = len(meta.get("cards", []))
-                self.logger.debug(f"[vault] Accepted {p.name} cards={cards_count} fresh={is_fresh}")
-                yield p, meta, is_fresh
-            else:
-                self.logger.debug(f"[vault] Skipped {p.name}: {reason}")
+        paths = list(iter_markdown_files(self.root))
+        if not paths:
+            return
+
+        # Each check is stat + read + hash + parse, i.e. I/O-dominated and
+        # independent per file, so fan it out across threads. ex.map preserves
+        # path order, keeping the yield order deterministic; ContentCache
+        # serializes its own sqlite access, so worker-thread writes are safe.
+        max_workers = min(32, (os.cpu_count() or 4) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            for p, (ok, _, reason, meta, is_fresh) in zip(
+                paths, ex.map(self._quick_check_file, paths), strict=True
+            ):
+                if ok and meta:
+                    cards_count = len(meta.get("cards", []))
+                    self.logger.debug(
+                        f"[vault] Accepted {p.name} cards={cards_count} fresh={is_fresh}"
+                    )
+                    yield p, meta, is_fresh
+                else:
+                    self.logger.debug(f"[vault] Skipped {p.name}: {reason}")
 
     def _quick_check_file(
         self, md_file: Path
@@ -58,18 +122,24 @@ class VaultService:
                 pass
 
         try:
-            text = md_file.read_text(encoding="utf-8", errors="strict")
-            file_hash = hashlib.md5(text.encode("utf-8")).hexdigest()
+            # Heuristic on the raw head before committing to a full read:
+            # files without an opening fence or any arete marker in the first
+            # 4KB can't be arete notes, so skip the read/decode/hash entirely.
+            with md_file.open("rb") as f:
+                head = f.read(4096)
+                probe = head.removeprefix(b"\xef\xbb\xbf").lstrip()
+                if not probe.startswith(b"---"):
+                    return (False, 0, "not_arete_file", None, True)
+                if not _FM_MARKER.search(head):
+                    return (False, 0, "not_arete_file", None, True)
+                data = head + f.read() if len(head) == 4096 else head
+            text = data.decode("utf-8")
         except Exception as e:
             return (False, 0, f"read_error:{e}", None, True)
 
-        # Heuristic: only parse if it looks like an arete file
-        # We check the first 2KB for efficiency
-        header = text[:2048].lower()
-        if "arete:" not in header and "cards:" not in header:
-            return (False, 0, "not_arete_file", None, True)
+        file_hash = _content_fingerprint(data)
 
-        meta, _body = parse_frontmatter(text)
+        meta = _memoized_parse(file_hash, text)
         if not meta or "__yaml_error__" in meta:
             return (False, 0, "no_or_bad_yaml", None, True)
 
@@ -119,7 +189,7 @@ class VaultService:
 
                         # Update cache
                         if self.cache:
-                            new_hash = hashlib.md5(new_text.encode("utf-8")).hexdigest()
+                            new_hash = _content_fingerprint(new_text.encode("utf-8"))
                             st = md_path.stat()
                             self.cache.set_file_meta(
                                 md_path, new_hash, meta, mtime=st.st_mtime, size=st.st_size
@@ -129,17 +199,36 @@ class VaultService:
 
         return count
 
-    def apply_updates(self, updates: list[UpdateItem], dry_run: bool = False):
-        """Write back new NIDs/CIDs to the markdown files."""
-        by_file: dict[Path, list[UpdateItem]] = defaultdict(list)
-        for u in updates:
-            if u.ok and (u.new_nid or u.new_cid):
-                by_file[u.source_file].append(u)
+    def apply_updates(
+        self,
+        updates: list[UpdateItem],
+        dry_run: bool = False,
+        meta_by_file: dict[Path, dict[str, Any]] | None = None,
+    ):
+        """Write back new NIDs/CIDs to the markdown files.
+
+        ``meta_by_file`` lets callers hand over frontmatter already parsed
+        during the scan stage; files found there skip the YAML re-parse and
+        only need the body sliced out of the raw text.
+        """
+        # Sort once on the stringified path and group, instead of hashing
+        # Path objects (which stringify internally) once per update.
+        writable = sorted(
+            (u for u in updates if u.ok and (u.new_nid or u.new_cid)),
+            key=lambda u: str(u.source_file),
+        )
 
-        for md_path, ups in by_file.items():
+        for md_path, group in groupby(writable, key=lambda u: u.source_file):
+            ups = list(group)
             try:
                 text = md_path.read_text(encoding="utf-8")
-                meta, body = parse_frontmatter(text)
+                meta = meta_by_file.get(md_path) if meta_by_file else None
+                if meta is not None:
+                    stripped = text.lstrip("﻿")
+                    span = _find_fm_span(stripped)
+                    body = stripped[span[2] :] if span else stripped
+                else:
+                    meta, body = parse_frontmatter(text)
                 if not meta or "__yaml_error__" in meta:
                     continue
                 cards = meta.get("cards", [])
@@ -182,7 +271,7 @@ class VaultService:
                         # Fix for Hot Sync: Update cache immediately since we changed mtime!
                         if self.cache:
                             try:
-                                new_hash = hashlib.md5(new_text.encode("utf-8")).hexdigest()
+                                new_hash = _content_fingerprint(new_text.encode("utf-8"))
                                 st = md_path.stat()
                                 self.cache.set_file_meta(
                                     md_path, new_hash, meta, mtime=st.st_mtime, size=st.st_size
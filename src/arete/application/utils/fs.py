@@ -25,6 +25,31 @@ def iter_markdown_files(root: Path) -> Iterable[Path]:
         yield p
 
 
+def read_frontmatter_only(path: Path, max_bytes: int = 16384) -> str:
+    """Read just enough of a file to cover its YAML frontmatter.
+
+    Returns the text up to and including the closing ``---`` line when it
+    falls inside the first ``max_bytes``; otherwise falls back to the full
+    file so callers never see a truncated frontmatter block.
+    """
+    with open(path, "rb") as f:
+        chunk = f.read(max_bytes)
+        if len(chunk) < max_bytes:
+            # Whole file fits in one chunk
+            return chunk.decode("utf-8")
+
+        end = chunk.find(b"\n---\n", 3)
+        if end != -1:
+            return chunk[: end + 5].decode("utf-8")
+        end = chunk.find(b"\n---\r\n", 3)
+        if end != -1:
+            return chunk[: end + 6].decode("utf-8")
+
+        # Closing marker not found in the prefix (or uses unusual whitespace);
+        # read the rest rather than risk handing back half a frontmatter block.
+        return (chunk + f.read()).decode("utf-8")
+
+
 def file_md5(p: Path) -> str:
     h = hashlib.md5()
     with open(p, "rb") as f:
@@ -1,6 +1,7 @@
+import io
 import re
 import unicodedata
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml  # type: ignore
 import yaml.constructor
@@ -27,72 +28,112 @@ def normalize_filename(name: str) -> str:
     """
     return unicodedata.normalize("NFC", name)
 
+
 # ---------- Math: Normalize to \( \) and \[ \] delimiters ----------
 
+# All hot-path patterns are compiled once at import: these functions run per
+# file during vault scans, and per-call re.compile (or re.sub's cache lookup)
+# adds up across thousands of markdown files.
+#
+# One alternation covers all six delimiter styles so conversion is a single
+# scan over the text instead of six sequential re.sub passes (each of which
+# allocated an intermediate copy of the whole document). Block forms come
+# first so `$$` wins over `$`; dispatch is on the named group that matched.
+_MATH_DELIMS = re.compile(
+    r"(?<!\\)\$\$(?P<bd>.*?)(?<!\\)\$\$"
+    r"|\[\$\$\]\s*(?P<bc>.*?)\s*\[/\$\$\]"
+    r"|\\\[\s*(?P<bb>.*?)\s*\\\]"
+    r"|(?<!\\)\$(?!\$)(?P<i_d>.*?)(?<!\\)\$"
+    r"|\[\$\]\s*(?P<i_b>.*?)\s*\[/\$\]"
+    r"|\\\(\s*(?P<i_p>.*?)\s*\\\)",
+    re.DOTALL,
+)
+
+_BLOCK_GROUPS = frozenset({"bd", "bc", "bb"})
+
+_EMPTY_FM = re.compile(r"^---\s*\n(\s*\n)*---\s*\n")
+_TEMPLATE_TAG = re.compile(r"(:\s*)\{\{(.*?)\}\}")
+_SAME_LINE_NID = re.compile(r"([^\n])\s+(nid|cid):")
+_BAD_BLOCK_SCALAR = re.compile(r"(\|[-+]?)\s*(['\"])")
+# One-pass gate for _preprocess_frontmatter_text: matches iff any of its
+# individual fixes could apply (tab, bare template tag, same-line nid/cid,
+# quoted block scalar). Clean frontmatter short-circuits all four passes.
+_FM_NEEDS_FIX = re.compile(r"\t|:\s*\{\{|[^\n]\s+(?:nid|cid):|\|[-+]?\s*['\"]")
+_QUOTED_LINE = re.compile(r'^(\s*(?:-\s*)?[^:]+:\s*)"(.*)"\s*$')
+_BS_NEXT = re.compile(r"\\(.?)")
+
+
+def _math_sub(m: re.Match) -> str:
+    group = m.lastgroup or ""
+    # Stripping reproduces what the old multi-pass version did: converted
+    # blocks were re-matched by the bracket/paren patterns, which trimmed
+    # the surrounding whitespace.
+    inner = (m.group(group) or "").strip()
+    if group in _BLOCK_GROUPS:
+        return r"\[" + inner + r"\]"
+    return r"\(" + inner + r"\)"
 
-def convert_math_to_tex_delimiters(text: str) -> str:
-    # 1) Blocks first
-    block_dollars = re.compile(r"(?<!\\)\$\$(.*?)(?<!\\)\$\$", re.DOTALL)
-    block_brackets = re.compile(r"\\\[\s*(.*?)\s*\\\]", re.DOTALL)
-    block_bbcode = re.compile(r"\[\$\$\]\s*(.*?)\s*\[/\$\$\]", re.DOTALL)
 
-    def to_block(m: re.Match) -> str:
-        return r"\[" + m.group(1) + r"\]"
+def convert_math_to_tex_delimiters(text: str) -> str:
+    return _MATH_DELIMS.sub(_math_sub, text)
 
-    out = text
-    out = block_dollars.sub(to_block, out)
-    out = block_bbcode.sub(to_block, out)
-    out = block_brackets.sub(to_block, out)
 
-    # 2) Inline next
-    inline_dollar = re.compile(r"(?<!\\)\$(?!\$)(.*?)(?<!\\)\$", re.DOTALL)
-    inline_paren = re.compile(r"\\\(\s*(.*?)\s*\\\)", re.DOTALL)
-    inline_bbcode = re.compile(r"\[\$\]\s*(.*?)\s*\[/\$\]", re.DOTALL)
+# ---------- Frontmatter helpers ----------
 
-    def to_inline(m: re.Match) -> str:
-        return r"\(" + m.group(1) + r"\)"
 
-    out = inline_dollar.sub(to_inline, out)
-    out = inline_bbcode.sub(to_inline, out)
-    out = inline_paren.sub(to_inline, out)
+def _find_fm_span(md_text: str) -> tuple[int, int, int] | None:
+    r"""Locate the YAML frontmatter block in a single scan.
 
-    return out
+    Returns character offsets ``(yaml_start, yaml_end, body_start)`` such that
+    ``md_text[yaml_start:yaml_end]`` is the raw YAML (fences excluded) and
+    ``md_text[body_start:]`` is the body. Returns None when there is no opening
+    fence or the block is unclosed.
 
+    This replaces the old ``split("\\n")`` + re-join approach: no list of N
+    lines is materialized and the YAML/body come out as O(1) slices.
+    """
+    nl = md_text.find("\n")
+    if nl == -1 or md_text[:nl].strip() != "---":
+        return None
 
-# ---------- Frontmatter helpers ----------
+    n = len(md_text)
+    yaml_start = nl + 1
+    pos = yaml_start
+    while pos <= n:
+        nl = md_text.find("\n", pos)
+        end = n if nl == -1 else nl
+        # A fence line is anything that strips to "---" (matches the old
+        # line-by-line parser, including stray surrounding whitespace).
+        if md_text[pos:end].strip() == "---":
+            yaml_end = yaml_start if pos == yaml_start else pos - 1
+            body_start = n if nl == -1 else nl + 1
+            return yaml_start, yaml_end, body_start
+        if nl == -1:
+            break
+        pos = nl + 1
+    return None
 
 
-def parse_frontmatter(md_text: str) -> tuple[dict[str, Any], str]:
+def parse_frontmatter(
+    md_text: str, *, _span: tuple[int, int, int] | None = None
+) -> tuple[dict[str, Any], str]:
     """Parse YAML frontmatter from markdown text.
 
-    Uses line-by-line parsing instead of regex for reliability.
+    Uses a single bounds-scan instead of regex for reliability. Callers that
+    already located the frontmatter (and have not modified the text since) can
+    forward the bounds via ``_span`` to skip the re-scan.
     """
     # Handle potential BOM (Byte Order Mark)
     md_text = md_text.lstrip("\ufeff")
 
-    lines = md_text.split("\n")
-
-    # Check for opening ---
-    if not lines or lines[0].strip() != "---":
+    span = _span if _span is not None else _find_fm_span(md_text)
+    if span is None:
+        # No opening --- or no closing ---, return empty
         return {}, md_text
 
-    # Find closing ---
-    yaml_end_line = None
-    for i, line in enumerate(lines[1:], start=1):
-        if line.strip() == "---":
-            yaml_end_line = i
-            break
-
-    if yaml_end_line is None:
-        # No closing ---, return empty
-        return {}, md_text
-
-    # Extract YAML content and body
-    yaml_lines = lines[1:yaml_end_line]
-    body_lines = lines[yaml_end_line + 1 :]
-
-    raw = "\n".join(yaml_lines)
-    body = "\n".join(body_lines)
+    yaml_start, yaml_end, body_start = span
+    raw = md_text[yaml_start:yaml_end]
+    body = md_text[body_start:]
 
     # Fix tabs (common user error)
     if "\t" in raw:
@@ -103,19 +144,8 @@ def parse_frontmatter(md_text: str) -> tuple[dict[str, Any], str]:
         meta = yaml.load(raw, Loader=UniqueKeyLoader) or {}
 
         # Add offset to __line__ to make it absolute (account for opening ---)
-        offset = 1  # Opening --- is line 0, YAML starts at line 1
-
-        def _add_offset(d):
-            if isinstance(d, dict):
-                if "__line__" in d:
-                    d["__line__"] += offset
-                for v in d.values():
-                    _add_offset(v)
-            elif isinstance(d, list):
-                for v in d:
-                    _add_offset(v)
-
-        _add_offset(meta)
+        # Opening --- is line 0, YAML starts at line 1
+        _add_line_offset(meta, 1)
 
     except Exception as e:
         return {"__yaml_error__": str(e)}, md_text
@@ -123,18 +153,55 @@ def parse_frontmatter(md_text: str) -> tuple[dict[str, Any], str]:
     return meta, body
 
 
-class UniqueKeyLoader(yaml.SafeLoader):
+def _add_line_offset(root: Any, offset: int) -> None:
+    """Shift every nested __line__ marker by ``offset``, in place.
+
+    Walks with an explicit stack rather than recursion: one loop iteration
+    per node instead of a Python call frame, and no depth limit.
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if "__line__" in node:
+                node["__line__"] += offset
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+
+# Prefer libyaml's C scanner — roughly an order of magnitude faster than the
+# pure-Python one for frontmatter-sized documents. Not every PyYAML build
+# ships it, so fall back to the Python loader when absent. The static type is
+# pinned to SafeLoader so the conditional base class type-checks.
+if TYPE_CHECKING:
+    _SafeLoaderBase = yaml.SafeLoader
+else:
+    try:
+        _SafeLoaderBase = yaml.CSafeLoader
+    except AttributeError:  # pragma: no cover - depends on the PyYAML build
+        _SafeLoaderBase = yaml.SafeLoader
+
+
+class UniqueKeyLoader(_SafeLoaderBase):
     """Custom YAML loader that forbids duplicate keys."""
 
     def construct_mapping(self, node, deep=False):
-        mapping = set()
+        seen = set()
         for key_node, _ in node.value:
-            key = self.construct_object(key_node, deep=deep)
-            if key in mapping:
+            # Construct scalar keys so equal keys with different raw forms
+            # (1 vs 01, "a" vs 'a') still collide — scalar construction is
+            # cheap. Composite keys may construct to unhashable containers,
+            # so those use the raw (tag, serialized value) form instead.
+            if isinstance(key_node, yaml.ScalarNode):
+                label = key = self.construct_object(key_node, deep=deep)
+            else:
+                label = key = (key_node.tag, str(key_node.value))
+            if key in seen:
                 raise yaml.constructor.ConstructorError(
-                    None, None, f"found duplicate key '{key}'", key_node.start_mark
+                    None, None, f"found duplicate key '{label}'", key_node.start_mark
                 )
-            mapping.add(key)
+            seen.add(key)
 
         result = super().construct_mapping(node, deep)
         if isinstance(result, dict):
@@ -146,26 +213,19 @@ class UniqueKeyLoader(yaml.SafeLoader):
 def validate_frontmatter(md_text: str) -> dict[str, Any]:
     """Parse frontmatter and raise detailed exceptions on failure.
 
-    Use line-by-line parsing instead of regex for reliability.
+    Uses a single bounds-scan instead of regex for reliability.
     Return the metadata dict if successful.
     """
     # Handle potential BOM (Byte Order Mark)
     md_text = md_text.lstrip("\ufeff")
 
-    lines = md_text.split("\n")
-
-    # Check for opening ---
-    if not lines or lines[0].strip() != "---":
-        return {}
-
-    # Find closing ---
-    yaml_end_line = None
-    for i, line in enumerate(lines[1:], start=1):
-        if line.strip() == "---":
-            yaml_end_line = i
-            break
-
-    if yaml_end_line is None:
+    span = _find_fm_span(md_text)
+    if span is None:
+        nl = md_text.find("\n")
+        first = md_text if nl == -1 else md_text[:nl]
+        if first.strip() != "---":
+            # No opening ---
+            return {}
         # Unclosed frontmatter
         err = yaml.scanner.ScannerError(
             problem="Unclosed YAML frontmatter. Found starting '---' but no closing '---'.",
@@ -174,8 +234,8 @@ def validate_frontmatter(md_text: str) -> dict[str, Any]:
         raise err
 
     # Extract YAML content
-    yaml_lines = lines[1:yaml_end_line]
-    raw = "\n".join(yaml_lines)
+    yaml_start, yaml_end, _ = span
+    raw = md_text[yaml_start:yaml_end]
 
     # Offset for line numbers (opening --- is line 0)
     offset = 1
@@ -196,58 +256,116 @@ def validate_frontmatter(md_text: str) -> dict[str, Any]:
         return yaml.load(raw, Loader=UniqueKeyLoader) or {}
     except yaml.YAMLError as e:
         # Adjust the line number in the exception to match the file
-        if hasattr(e, "problem_mark"):
-            e.problem_mark.line += offset  # type: ignore
+        mark = getattr(e, "problem_mark", None)
+        if mark is not None:
+            try:
+                mark.line += offset
+            except AttributeError:
+                # libyaml marks are immutable; swap in an adjusted Python Mark
+                e.problem_mark = yaml.error.Mark(  # type: ignore[attr-defined]
+                    mark.name,
+                    getattr(mark, "index", 0),
+                    mark.line + offset,
+                    mark.column,
+                    getattr(mark, "buffer", None),
+                    getattr(mark, "pointer", 0),
+                )
         raise e
 
 
+def _has_internal_keys(d: Any) -> bool:
+    """Return True if any nested dict carries a ``__``-prefixed key.
+
+    Read-only pre-scan for ``scrub_internal_keys``: walks with an explicit
+    stack instead of recursing per node.
+    """
+    scan: list[Any] = [d]
+    while scan:
+        node = scan.pop()
+        if isinstance(node, dict):
+            if any(k.startswith("__") for k in node):
+                return True
+            scan.extend(node.values())
+        elif isinstance(node, list):
+            scan.extend(node)
+    return False
+
+
 def scrub_internal_keys(d: Any) -> Any:
-    """Recursively remove keys starting with __."""
-    if isinstance(d, dict):
-        return {k: scrub_internal_keys(v) for k, v in d.items() if not k.startswith("__")}
-    elif isinstance(d, list):
-        return [scrub_internal_keys(v) for v in d]
-    return d
+    """Remove keys starting with __ from nested dicts, returning a clean copy.
+
+    The input is left untouched. When no internal key exists anywhere in the
+    tree — the common case for user files — the input is returned as-is
+    instead of being copied.
+    """
+    if not isinstance(d, (dict, list)):
+        return d
+
+    # Only build the copy if there is something to scrub.
+    if not _has_internal_keys(d):
+        return d
+
+    root: Any = {} if isinstance(d, dict) else [None] * len(d)
+    stack: list[tuple[Any, Any]] = [(d, root)]
+    while stack:
+        src, dst = stack.pop()
+        if isinstance(src, dict):
+            items: Any = ((k, v) for k, v in src.items() if not k.startswith("__"))
+        else:
+            items = enumerate(src)
+        for key, value in items:
+            if isinstance(value, dict):
+                child: Any = {}
+                stack.append((value, child))
+            elif isinstance(value, list):
+                child = [None] * len(value)
+                stack.append((value, child))
+            else:
+                child = value
+            dst[key] = child
+    return root
 
 
 def rebuild_markdown_with_frontmatter(meta: dict[str, Any], body: str) -> str:
     clean_meta = scrub_internal_keys(meta)
-    yaml_text = yaml.dump(
+    # Dump into an explicit stream so the emitter skips its own
+    # join-and-return pass over the full output.
+    buf = io.StringIO()
+    yaml.dump(
         clean_meta,
+        buf,
         Dumper=_LiteralDumper,
         sort_keys=False,
         allow_unicode=True,
         default_flow_style=False,
         width=10**9,
     )
-    return f"---\n{yaml_text}---\n{body}"
+    return f"---\n{buf.getvalue()}---\n{body}"
 
 
 def _extract_frontmatter_bounds(md_text: str) -> tuple[str, int, int] | None:
     """Extract frontmatter content and its character bounds from markdown text.
 
     Returns (yaml_content, start_index, end_index) or None if no frontmatter.
-    Uses line-by-line parsing (no regex).
+    Uses a single bounds-scan (no regex).
     """
-    lines = md_text.split("\n")
-
-    if not lines or lines[0].strip() != "---":
+    span = _find_fm_span(md_text)
+    if span is None:
         return None
 
-    # Find closing ---
-    char_pos = len(lines[0]) + 1  # +1 for newline
-    for i, line in enumerate(lines[1:], start=1):
-        if line.strip() == "---":
-            # Found closing ---
-            start = len(lines[0]) + 1  # After opening ---\n
-            yaml_content = "\n".join(lines[1:i])
-            return yaml_content, start, start + len(yaml_content)
-        char_pos += len(line) + 1  # +1 for newline
-
-    return None
+    yaml_start, yaml_end, _ = span
+    return md_text[yaml_start:yaml_end], yaml_start, yaml_end
 
 
 # ---------- Build apy editor-note text ----------
+
+# Known models get a fixed field order; anything else falls back to sorting.
+_MODEL_FIELD_ORDER = {
+    "basic": ("Front", "Back"),
+    "cloze": ("Text", "Back Extra"),
+}
+
+
 def _preprocess_frontmatter_text(fm_text: str) -> str:
     """Minimal text fixes to make broken YAML parseable.
 
@@ -255,18 +373,22 @@ def _preprocess_frontmatter_text(fm_text: str) -> str:
     All *formatting* (block scalars, indentation, quote styles) is handled by
     the ``_LiteralDumper`` round-trip in ``apply_fixes``.
     """
+    # Single scan over the buffer; clean frontmatter skips every pass below.
+    if _FM_NEEDS_FIX.search(fm_text) is None:
+        return fm_text
+
     # Tabs → spaces (YAML spec forbids tabs for indentation)
     if "\t" in fm_text:
         fm_text = fm_text.replace("\t", "  ")
 
     # Quote bare template tags: {{title}} → "{{title}}" (YAML flow-mapping syntax)
-    fm_text = re.sub(r"(:\s*)\{\{(.*?)\}\}", r'\1"{{\2}}"', fm_text)
+    fm_text = _TEMPLATE_TAG.sub(r'\1"{{\2}}"', fm_text)
 
     # Split same-line metadata: "content  nid: '123'" → separate lines
-    fm_text = re.sub(r"([^\n])\s+(nid|cid):", r"\1\n  \2:", fm_text)
+    fm_text = _SAME_LINE_NID.sub(r"\1\n  \2:", fm_text)
 
     # Fix invalid block scalar start: `| '...` → `'...`
-    fm_text = re.sub(r"(\|[-+]?)\s*(['\"])", r"\2", fm_text)
+    fm_text = _BAD_BLOCK_SCALAR.sub(r"\2", fm_text)
 
     return fm_text
 
@@ -289,25 +411,28 @@ def apply_fixes(md_text: str) -> str:
     """
     # Strip leading empty frontmatter blocks
     md_text = md_text.lstrip()
-    while re.match(r"^---\s*\n(\s*\n)*---\s*\n", md_text):
-        md_text = re.sub(r"^---\s*\n(\s*\n)*---\s*\n", "", md_text, count=1)
+    while _EMPTY_FM.match(md_text):
+        md_text = _EMPTY_FM.sub("", md_text, count=1)
         md_text = md_text.lstrip()
 
-    bounds = _extract_frontmatter_bounds(md_text)
-    if bounds is None:
+    span = _find_fm_span(md_text)
+    if span is None:
         return md_text
 
-    original_fm, fm_start, fm_end = bounds
+    fm_start, fm_end, _ = span
+    original_fm = md_text[fm_start:fm_end]
 
     # Phase 1: text-level pre-processing
     preprocessed_fm = _preprocess_frontmatter_text(original_fm)
 
-    # Apply text fixes if needed
+    # Apply text fixes if needed; edits shift the offsets, so only reuse the
+    # span when the text is untouched.
     if preprocessed_fm != original_fm:
         md_text = md_text[:fm_start] + preprocessed_fm + md_text[fm_end:]
+        span = None
 
     # Phase 2: parse → fix dict → dump
-    meta, body = parse_frontmatter(md_text)
+    meta, body = parse_frontmatter(md_text, _span=span)
 
     if not meta or "__yaml_error__" in meta:
         return md_text  # Can't parse; return with text fixes only
@@ -331,30 +456,22 @@ def fix_mathjax_escapes(md_text: str) -> str:
     # Simple heuristic for YAML 1.2 double-quote escapes: 0 abt nr vf e " / \ L P _
     valid_escapes = '0abtnrvfe"/\\ '
 
+    def fix_escape(m: re.Match) -> str:
+        # Valid escape sequence (like \n or \\): keep as-is.
+        # Broken escape (like \i or \{) or a trailing backslash: escape the
+        # backslash and leave the following char untouched.
+        c = m.group(1)
+        if c and c in valid_escapes:
+            return "\\" + c
+        return "\\\\" + c
+
     def fix_line(line: str) -> str:
         # Match lines that look like key: "..." or - key: "..."
         # We use a regex to find the content between the first and last quote.
-        import re
-
-        match = re.search(r'^(\s*(?:-\s*)?[^:]+:\s*)"(.*)"\s*$', line)
+        match = _QUOTED_LINE.search(line)
         if match:
             prefix, val = match.groups()
-            new_val = ""
-            i = 0
-            while i < len(val):
-                if val[i] == "\\":
-                    # Check if it's a valid escape sequence (like \n or \\)
-                    if i + 1 < len(val) and val[i + 1] in valid_escapes:
-                        new_val += "\\" + val[i + 1]
-                        i += 2
-                    else:
-                        # Broken escape (like \i or \{). Escape the backslash.
-                        new_val += "\\\\"
-                        i += 1
-                else:
-                    new_val += val[i]
-                    i += 1
-            return f'{prefix}"{new_val}"'
+            return f'{prefix}"{_BS_NEXT.sub(fix_escape, val)}"'
         return line
 
     lines = original_fm.split("\n")
@@ -376,22 +493,20 @@ def make_editor_note(
     cid: str | None = None,
     markdown: bool = True,
 ) -> str:
-    lines = []
+    # Write into one growing buffer instead of accumulating a list of lines
+    # and joining — bulk exports call this once per note.
+    buf = io.StringIO()
+    write = buf.write
     if nid:
-        lines.append(f"nid: {nid}")
-    if cid and not nid:
-        lines.append(f"cid: {cid}")
-    lines += [f"model: {model}", f"deck: {deck}"]
+        write(f"nid: {nid}\n")
+    elif cid:
+        write(f"cid: {cid}\n")
+    write(f"model: {model}\ndeck: {deck}\n")
     if tags:
-        lines.append(f"tags: {' '.join(tags)}")
-    lines += [f"markdown: {'true' if markdown else 'false'}", "", "# Note", ""]
-    mlow = model.lower()
-    if mlow == "basic":
-        f_list = ["Front", "Back"]
-    elif mlow == "cloze":
-        f_list = ["Text", "Back Extra"]
-    else:
-        f_list = sorted(fields.keys())
+        write(f"tags: {' '.join(tags)}\n")
+    write(f"markdown: {'true' if markdown else 'false'}\n\n# Note\n")
+    order = _MODEL_FIELD_ORDER.get(model.lower())
+    f_list = list(order) if order else sorted(fields)
 
     # Always ensure _obsidian_source is included if present
     if "_obsidian_source" in fields and "_obsidian_source" not in f_list:
@@ -401,5 +516,5 @@ def make_editor_note(
         v = fields.get(k, "")
         if k == "Back Extra" and not v:
             v = fields.get("Extra", "")
-        lines += [f"## {k}", sanitize(v), ""]
-    return "\n".join(lines)
+        write(f"\n## {k}\n{sanitize(v)}\n")
+    return buf.getvalue()
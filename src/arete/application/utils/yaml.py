@@ -1,9 +1,23 @@
+from typing import TYPE_CHECKING
+
 import yaml  # type: ignore
 
 # ---------- YAML dumper that preserves multiline strings & math ----------
 
+# Prefer libyaml's C emitter (representers stay in Python, so the custom
+# str representer below still applies). Not every PyYAML build ships it.
+# The static type is pinned to SafeDumper so the conditional base class
+# type-checks.
+if TYPE_CHECKING:
+    _SafeDumperBase = yaml.SafeDumper
+else:
+    try:
+        _SafeDumperBase = yaml.CSafeDumper
+    except AttributeError:  # pragma: no cover - depends on the PyYAML build
+        _SafeDumperBase = yaml.SafeDumper
+
 
-class _LiteralDumper(yaml.SafeDumper):
+class _LiteralDumper(_SafeDumperBase):
     def ignore_aliases(self, data):
         return True
 
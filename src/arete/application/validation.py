@@ -31,7 +31,8 @@ class ValidationResult:
 
 def humanize_error(msg: str) -> str:
     """Translate technical PyYAML errors into user-friendly advice."""
-    if "mapping values are not allowed here" in msg:
+    # Pure-Python loader says "here"; libyaml says "in this context".
+    if "mapping values are not allowed" in msg:
         return (
             "Indentation Error: You likely have a nested key (like 'bad_indent') "
             "at the wrong level. Check your spaces."
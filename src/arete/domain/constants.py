@@ -12,7 +12,12 @@ REQUEST_TIMEOUT = 30.0
 RESPONSIVENESS_TIMEOUT = 2.0
 SEARCH_TRUNCATE_LEN = 100
 CHUNK_SIZE = 500
+DELETE_CHUNK_SIZE = 1000  # Max notes removed per direct-DB call
+SQLITE_MAX_VARS = 900  # Stay under SQLite's 999 bind-parameter default
 SYNC_CONCURRENCY = 8  # Max concurrent card syncs within a batch
+HTTP_MAX_CONNECTIONS = 64
+HTTP_KEEPALIVE_CONNECTIONS = 32
+HTTP_KEEPALIVE_EXPIRY = 30.0  # seconds
 
 # ---------- FSRS ----------
 FSRS_DIFFICULTY_SCALE = 10.0
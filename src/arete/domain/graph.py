@@ -45,6 +45,9 @@ class DependencyGraph:
     related: dict[str, list[str]] = field(default_factory=dict)  # id → [related ids]
     unresolved_refs: dict[str, list[str]] = field(default_factory=dict)  # id → [unresolved refs]
     _graph: nx.DiGraph = field(default_factory=nx.DiGraph, repr=False)
+    # Memoized cycle analysis (SCCs with >1 node); reset whenever edges change
+    # so repeated detect_cycles calls on a stable graph are free.
+    _cycles_cache: list[list[str]] | None = field(default=None, repr=False)
 
     @property
     def edge_count(self) -> int:
@@ -71,6 +74,7 @@ class DependencyGraph:
         """Add a 'requires' edge: from_id requires to_id."""
         if not self._graph.has_edge(to_id, from_id):
             self._graph.add_edge(to_id, from_id)
+            self._cycles_cache = None
 
     def add_related(self, from_id: str, to_id: str) -> None:
         """Add a 'related' edge: from_id is related to to_id."""
@@ -91,6 +95,18 @@ class DependencyGraph:
             return []
         return list(self._graph.successors(card_id))
 
+    def has_prerequisites(self, card_id: str) -> bool:
+        """Return True if the card has at least one direct prerequisite.
+
+        Checks the adjacency dict directly — no list is materialized, unlike
+        get_prerequisites — so whole-graph scans stay cheap.
+        """
+        return card_id in self._graph and bool(self._graph.pred[card_id])
+
+    def has_dependents(self, card_id: str) -> bool:
+        """Return True if at least one card requires this card."""
+        return card_id in self._graph and bool(self._graph.succ[card_id])
+
     def get_related(self, card_id: str) -> list[str]:
         """Get all related cards."""
         return self.related.get(card_id, [])
@@ -175,3 +175,11 @@ class AnkiBridge(ABC):
     async def close(self) -> None:
         """Release any held resources (e.g. HTTP clients, DB connections)."""
         pass
+
+    async def __aenter__(self) -> "AnkiBridge":
+        """Enter an adapter scope. Adapters may keep resources open until exit."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit the adapter scope, releasing held resources via close()."""
+        await self.close()
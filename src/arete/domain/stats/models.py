@@ -8,7 +8,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FsrsMemoryState:
     """FSRS memory state for a card.
 
@@ -24,7 +24,7 @@ class FsrsMemoryState:
     retrievability: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewEntry:
     """A single review log entry.
 
@@ -54,7 +54,7 @@ class ReviewEntry:
     retrievability: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CardStatsAggregate:
     """Comprehensive statistics for a card, combining Anki data with FSRS metrics.
 
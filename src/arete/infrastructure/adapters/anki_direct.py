@@ -1,21 +1,41 @@
 from __future__ import annotations
 
+import heapq
 import logging
 import re
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
+
+# May not exist in mocked test environments
+if TYPE_CHECKING:
+    from anki.cards import CardId
+    from anki.notes import NoteId
+else:
+    try:
+        from anki.cards import CardId
+        from anki.notes import NoteId
+    except ImportError:
+        CardId = int
+        NoteId = int
 
 from arete.domain.constants import (
     BROWSE_INITIAL_DELAY,
     BROWSE_POLL_ATTEMPTS,
     BROWSE_POLL_INTERVAL,
+    DELETE_CHUNK_SIZE,
     FSRS_DIFFICULTY_SCALE,
     MAX_PROBLEMATIC_NOTES,
+    SQLITE_MAX_VARS,
 )
 from arete.domain.interfaces import AnkiBridge
 from arete.domain.models import AnkiCardStats, AnkiDeck, UpdateItem, WorkItem
 from arete.infrastructure.anki.repository import AnkiRepository
 
+_HTML_STRIP = re.compile(r"<[^<]+?>")
+
 
 class AnkiDirectAdapter(AnkiBridge):
     """Direct Python adapter for Anki using the 'anki' library."""
@@ -24,10 +44,42 @@ class AnkiDirectAdapter(AnkiBridge):
         """Initialize with path to the Anki base directory."""
         self.anki_base = anki_base
         self.logger = logging.getLogger(__name__)
+        self._repo: AnkiRepository | None = None
+        self._scoped = False
+
+    async def __aenter__(self) -> AnkiDirectAdapter:
+        """Enter a scope in which all operations share one open collection."""
+        self._scoped = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Leave the scope and release the shared collection."""
+        self._scoped = False
+        await self.close()
+
+    @contextmanager
+    def _open_repo(self) -> Iterator[AnkiRepository]:
+        """Yield an open collection, reusing one across calls inside a scope.
+
+        Outside ``async with adapter:`` each operation opens and closes the
+        collection as before. Inside a scope the first operation opens it and
+        close() releases it, so a CLI invocation chaining deck, model and note
+        operations pays the open cost once instead of per call.
+        """
+        if not self._scoped:
+            with AnkiRepository(self.anki_base) as repo:
+                yield repo
+            return
+
+        if self._repo is None:
+            repo = AnkiRepository(self.anki_base)
+            repo.__enter__()
+            self._repo = repo
+        yield self._repo
 
     async def get_model_names(self) -> list[str]:
         """Return all model names from the Anki collection."""
-        with AnkiRepository(self.anki_base) as repo:
+        with self._open_repo() as repo:
             if repo.col:
                 return [m["name"] for m in repo.col.models.all()]
         return []
@@ -37,7 +89,7 @@ class AnkiDirectAdapter(AnkiBridge):
         # via 'col.decks.id(name)'.
         # So we can just return True or verify it exists.
         deck_name = deck.name if isinstance(deck, AnkiDeck) else deck
-        with AnkiRepository(self.anki_base) as repo:
+        with self._open_repo() as repo:
             if repo.col:
                 # col.decks.id(deck_name) creates it if missing
                 repo.col.decks.id(deck_name)
@@ -53,70 +105,20 @@ class AnkiDirectAdapter(AnkiBridge):
 
         # Batch operation: Open DB once
         try:
-            with AnkiRepository(self.anki_base) as repo:
-                for item in work_items:
-                    try:
-                        self.logger.debug(f"Processing {item.source_file} #{item.source_index}")
-
-                        note_data = item.note
-                        success = False
-                        new_nid = str(note_data.nid) if note_data.nid else None
-                        error_msg = None
-
-                        # 1. Try Update if NID exists
-                        if note_data.nid:
-                            try:
-                                updated = repo.update_note(int(note_data.nid), note_data)
-                                if updated:
-                                    success = True
-                                else:
-                                    # Note ID not found in DB? Fallback to Add?
-                                    # Ideally we trust the NID. If it's missing, it's deleted.
-                                    # Note with ID not found. Will create new note.
-                                    self.logger.warning(
-                                        f"Note {note_data.nid} not found. Creating new."
-                                    )
-                                    # Fallthrough to add
-                                    pass
-                            except Exception as e:
-                                error_msg = str(e)
-                                self.logger.error(f"Update failed for {note_data.nid}: {e}")
-
-                        # 2. Add if not updated/existing
-                        if not success and not error_msg:
-                            try:
-                                nid_int = repo.add_note(note_data)
-                                new_nid = str(nid_int)
-                                success = True
-                            except Exception as e:
-                                error_msg = f"Add failed: {e}"
-                                self.logger.error(error_msg)
-
-                        # 3. Compile Result
-                        results.append(
-                            UpdateItem(
-                                source_file=item.source_file,
-                                source_index=item.source_index,
-                                new_nid=new_nid,
-                                new_cid=None,  # CID not easily returned without extra query
-                                ok=success,
-                                error=error_msg,
-                                note=item.note,
-                            )
-                        )
-
-                    except Exception as e:
-                        # Catch-all for item failure
-                        results.append(
-                            UpdateItem(
-                                source_file=item.source_file,
-                                source_index=item.source_index,
-                                new_nid=None,
-                                new_cid=None,
-                                ok=False,
-                                error=f"Unexpected error: {e}",
-                            )
-                        )
+            with self._open_repo() as repo:
+
+                def _process_items() -> None:
+                    for item in work_items:
+                        self._sync_one(repo, item, results)
+
+                # Group the whole batch into one transaction: a single commit
+                # (fsync) at the end instead of one per note. Item-level
+                # failures are caught inside, so one bad note doesn't roll
+                # back the rest of the batch.
+                if repo.col and repo.col.db is not None:
+                    repo.col.db.transact(_process_items)
+                else:
+                    _process_items()
 
         except Exception as e:
             # DB Open failure
@@ -136,8 +138,71 @@ class AnkiDirectAdapter(AnkiBridge):
 
         return results
 
+    def _sync_one(self, repo: AnkiRepository, item: WorkItem, results: list[UpdateItem]) -> None:
+        """Add or update a single note, appending its UpdateItem to results."""
+        try:
+            self.logger.debug(f"Processing {item.source_file} #{item.source_index}")
+
+            note_data = item.note
+            success = False
+            new_nid = str(note_data.nid) if note_data.nid else None
+            error_msg = None
+
+            # 1. Try Update if NID exists
+            if note_data.nid:
+                try:
+                    updated = repo.update_note(int(note_data.nid), note_data)
+                    if updated:
+                        success = True
+                    else:
+                        # Note ID not found in DB? Fallback to Add?
+                        # Ideally we trust the NID. If it's missing, it's deleted.
+                        # Note with ID not found. Will create new note.
+                        self.logger.warning(f"Note {note_data.nid} not found. Creating new.")
+                        # Fallthrough to add
+                        pass
+                except Exception as e:
+                    error_msg = str(e)
+                    self.logger.error(f"Update failed for {note_data.nid}: {e}")
+
+            # 2. Add if not updated/existing
+            if not success and not error_msg:
+                try:
+                    nid_int = repo.add_note(note_data)
+                    new_nid = str(nid_int)
+                    success = True
+                except Exception as e:
+                    error_msg = f"Add failed: {e}"
+                    self.logger.error(error_msg)
+
+            # 3. Compile Result
+            results.append(
+                UpdateItem(
+                    source_file=item.source_file,
+                    source_index=item.source_index,
+                    new_nid=new_nid,
+                    new_cid=None,  # CID not easily returned without extra query
+                    ok=success,
+                    error=error_msg,
+                    note=item.note,
+                )
+            )
+
+        except Exception as e:
+            # Catch-all for item failure
+            results.append(
+                UpdateItem(
+                    source_file=item.source_file,
+                    source_index=item.source_index,
+                    new_nid=None,
+                    new_cid=None,
+                    ok=False,
+                    error=f"Unexpected error: {e}",
+                )
+            )
+
     async def get_deck_names(self) -> list[str]:
-        with AnkiRepository(self.anki_base) as repo:
+        with self._open_repo() as repo:
             if repo.col:
                 return repo.col.decks.all_names()
         return []
@@ -155,7 +220,7 @@ class AnkiDirectAdapter(AnkiBridge):
             List of Anki note IDs (nids)
 
         """
-        with AnkiRepository(self.anki_base) as repo:
+        with self._open_repo() as repo:
             if not repo.col:
                 return []
 
@@ -167,7 +232,7 @@ class AnkiDirectAdapter(AnkiBridge):
 
     async def find_all_arete_nids(self) -> list[int]:
         """Find all note IDs that have arete tags."""
-        with AnkiRepository(self.anki_base) as repo:
+        with self._open_repo() as repo:
             if not repo.col:
                 return []
             return repo.find_notes("tag:arete_*")
@@ -183,7 +248,7 @@ class AnkiDirectAdapter(AnkiBridge):
         """
         arete_ids: list[str] = []
 
-        with AnkiRepository(self.anki_base) as repo:
+        with self._open_repo() as repo:
             if not repo.col:
                 return []
 
@@ -202,7 +267,7 @@ class AnkiDirectAdapter(AnkiBridge):
 
     async def get_notes_in_deck(self, deck_name: str) -> dict[str, int]:
         # Enable Pruning support!
-        with AnkiRepository(self.anki_base) as repo:
+        with self._open_repo() as repo:
             if repo.col:
                 # Find direct notes
                 # query: "deck:name"
@@ -223,24 +288,27 @@ class AnkiDirectAdapter(AnkiBridge):
                 # Interface says: "Return mapping of {obsidian_nid: anki_nid}"
                 # If Anki notes don't have obsidian_nid stored, this is hard.
                 # But typically obsidian_nid IS the anki_nid.
-                # So maybe it returns {str(nid): nid}?
-                return {str(nid): nid for nid in nids}
+                # The prune pipeline matches keys against its string NID set,
+                # so str keys stay; zip/map keeps the loop in C for big decks.
+                return dict(zip(map(str, nids), nids, strict=True))
 
         return {}
 
     async def delete_notes(self, nids: list[int]) -> bool:
         if not nids:
             return True
-        with AnkiRepository(self.anki_base) as repo:
+        with self._open_repo() as repo:
             if repo.col:
-                from anki.notes import NoteId
-
-                repo.col.remove_notes([NoteId(n) for n in nids])
+                # Chunked so one huge deletion doesn't hold the write lock
+                # for the entire batch.
+                for start in range(0, len(nids), DELETE_CHUNK_SIZE):
+                    chunk = nids[start : start + DELETE_CHUNK_SIZE]
+                    repo.col.remove_notes(cast(Any, [NoteId(n) for n in chunk]))
                 return True
         return False
 
     async def delete_decks(self, names: list[str]) -> bool:
-        with AnkiRepository(self.anki_base) as repo:
+        with self._open_repo() as repo:
             if repo.col:
                 for name in names:
                     did = repo.col.decks.id(name)
@@ -255,7 +323,7 @@ class AnkiDirectAdapter(AnkiBridge):
         total_cards = 0
         problematic_notes = []
 
-        with AnkiRepository(self.anki_base) as repo:
+        with self._open_repo() as repo:
             if not repo.col:
                 return LearningStats(total_cards=0)
 
@@ -291,8 +359,10 @@ class AnkiDirectAdapter(AnkiBridge):
                 elif fields:
                     note_name = list(fields.values())[0]
 
-                # Strip HTML
-                note_name = re.sub("<[^<]+?>", "", note_name).strip()
+                # Strip HTML; skip the regex entirely for clean strings
+                if "<" in note_name:
+                    note_name = _HTML_STRIP.sub("", note_name)
+                note_name = note_name.strip()
 
                 problematic_notes.append(
                     NoteInsight(
@@ -303,12 +373,12 @@ class AnkiDirectAdapter(AnkiBridge):
                     )
                 )
 
-        # Sort and limit
-        problematic_notes.sort(key=lambda x: x.lapses, reverse=True)
-
+        # Top-K selection: O(N log K) instead of sorting every leech note
         return LearningStats(
             total_cards=total_cards,
-            problematic_notes=problematic_notes[:MAX_PROBLEMATIC_NOTES],
+            problematic_notes=heapq.nlargest(
+                MAX_PROBLEMATIC_NOTES, problematic_notes, key=lambda x: x.lapses
+            ),
         )
 
     async def get_card_stats(self, nids: list[int]) -> list[AnkiCardStats]:
@@ -317,67 +387,79 @@ class AnkiDirectAdapter(AnkiBridge):
         if not nids:
             return []
 
-        # We probably want to chunk this if nids is huge, but start simple.
-        with AnkiRepository(self.anki_base) as repo:
-            if not repo.col:
+        with self._open_repo() as repo:
+            if not repo.col or repo.col.db is None:
                 return []
 
+            # Decks live in one JSON blob; resolve all names once instead of
+            # a decks.get() per card.
+            deck_names = {d.id: d.name for d in repo.col.decks.all_names_and_ids()}
+
+            # One SQL pass maps every nid to its cards, replacing a parsed
+            # find_cards("nid:...") search per note. Chunked to stay under
+            # SQLite's bind-parameter limit.
+            cids_by_nid: dict[int, list[CardId]] = defaultdict(list)
+            for start in range(0, len(nids), SQLITE_MAX_VARS):
+                chunk = nids[start : start + SQLITE_MAX_VARS]
+                placeholders = ",".join("?" * len(chunk))
+                query = f"SELECT nid, id FROM cards WHERE nid IN ({placeholders}) ORDER BY ord"
+                for nid, cid in repo.col.db.execute(query, *chunk):
+                    cids_by_nid[nid].append(cid)
+
             for nid in nids:
                 try:
                     # A note can have multiple cards
-                    # We need to find cards for this note.
-                    # Use col.find_cards(f"nid:{nid}")
-                    cids = repo.col.find_cards(f"nid:{nid}")
-
-                    for cid in cids:
-                        card = repo.col.get_card(cid)
-                        deck = repo.col.decks.get(card.did)
-                        deck_name = deck["name"] if deck else "Unknown"
-
-                        # Retrieve difficulty from FSRS memory state if available?
-                        # Anki's python library usually exposes FSRS data if v3 scheduler is on?
-                        # card.memory_state (v3) might have it.
-                        difficulty = None
-                        if hasattr(card, "memory_state") and card.memory_state:
-                            # FSRS memory state: stability, difficulty, etc.
-                            # But access might be opaque. check attributes.
-                            # Actually, standard Anki (recent versions) stores custom_data
-                            # or memory_state
-                            # memory_state.difficulty is 1-10 normally
-                            if hasattr(card.memory_state, "difficulty"):
-                                difficulty = card.memory_state.difficulty / FSRS_DIFFICULTY_SCALE
-
-                        try:
-                            note = repo.col.get_note(card.nid)
-                            front = note.fields[0]  # Approximated front
-                        except Exception:
-                            front = None
-
-                        stats_list.append(
-                            AnkiCardStats(
-                                card_id=card.id,
-                                note_id=card.nid,
-                                lapses=card.lapses,
-                                ease=card.factor,
-                                difficulty=difficulty,
-                                deck_name=deck_name,
-                                interval=card.ivl,
-                                due=card.due,
-                                reps=card.reps,
-                                average_time=0,  # Not easily available?
-                                front=front,
-                            )
-                        )
+                    for cid in cids_by_nid.get(nid, ()):
+                        stats_list.append(self._build_card_stats(repo, cid, deck_names))
                 except Exception as e:
                     self.logger.warning(f"Failed to fetch stats for nid={nid}: {e}")
 
         return stats_list
 
+    def _build_card_stats(
+        self, repo: AnkiRepository, cid: CardId, deck_names: dict[int, str]
+    ) -> AnkiCardStats:
+        """Assemble one card's stats from the open collection."""
+        if not repo.col:
+            raise RuntimeError("Collection not open")
+        card = repo.col.get_card(cid)
+
+        # Retrieve difficulty from FSRS memory state if available
+        # (card.memory_state, v3 scheduler; difficulty is 1-10).
+        # getattr with a default replaces the hasattr-then-access
+        # pairs: one attribute walk per lookup instead of two.
+        difficulty = None
+        ms = getattr(card, "memory_state", None)
+        if ms:
+            difficulty_raw = getattr(ms, "difficulty", None)
+            if difficulty_raw is not None:
+                difficulty = difficulty_raw / FSRS_DIFFICULTY_SCALE
+
+        try:
+            note = repo.col.get_note(card.nid)
+            front = note.fields[0]  # Approximated front
+        except Exception:
+            front = None
+
+        return AnkiCardStats(
+            card_id=card.id,
+            note_id=card.nid,
+            lapses=card.lapses,
+            ease=card.factor,
+            difficulty=difficulty,
+            deck_name=deck_names.get(card.did, "Unknown"),
+            interval=card.ivl,
+            due=card.due,
+            reps=card.reps,
+            average_time=0,  # Not easily available?
+            front=front,
+        )
+
     async def suspend_cards(self, cids: list[int]) -> bool:
         """Suspend cards via Direct DB (queue=-1)."""
         if not cids:
             return True
-        with AnkiRepository(self.anki_base) as repo:
+        with self._open_repo() as repo:
             if not repo.col:
                 return False
             try:
@@ -391,7 +473,7 @@ class AnkiDirectAdapter(AnkiBridge):
         """Unsuspend cards via Direct DB."""
         if not cids:
             return True
-        with AnkiRepository(self.anki_base) as repo:
+        with self._open_repo() as repo:
             if not repo.col:
                 return False
             try:
@@ -402,7 +484,7 @@ class AnkiDirectAdapter(AnkiBridge):
                 return False
 
     async def get_model_styling(self, model_name: str) -> str:
-        with AnkiRepository(self.anki_base) as repo:
+        with self._open_repo() as repo:
             if not repo.col:
                 return ""
             model = repo.col.models.by_name(model_name)
@@ -412,7 +494,7 @@ class AnkiDirectAdapter(AnkiBridge):
 
     async def get_model_templates(self, model_name: str) -> dict[str, dict[str, str]]:
         """Return template map, e.g. ``{"Card 1": {"Front": ..., "Back": ...}}``."""
-        with AnkiRepository(self.anki_base) as repo:
+        with self._open_repo() as repo:
             if not repo.col:
                 return {}
             model = repo.col.models.by_name(model_name)
@@ -494,7 +576,7 @@ class AnkiDirectAdapter(AnkiBridge):
             return []
 
         cids_ordered = []
-        with AnkiRepository(self.anki_base) as repo:
+        with self._open_repo() as repo:
             if not repo.col:
                 return []
 
@@ -533,7 +615,7 @@ class AnkiDirectAdapter(AnkiBridge):
         if not cids:
             return False
 
-        with AnkiRepository(self.anki_base) as repo:
+        with self._open_repo() as repo:
             if not repo.col:
                 return False
 
@@ -575,5 +657,7 @@ class AnkiDirectAdapter(AnkiBridge):
             return True
 
     async def close(self) -> None:
-        """No long-lived resources to clean up in Direct backend."""
-        pass
+        """Release the shared collection if a scope left one open."""
+        if self._repo is not None:
+            repo, self._repo = self._repo, None
+            repo.__exit__(None, None, None)
@@ -3,9 +3,13 @@
 Implements StatsRepository by querying the Anki collection directly.
 """
 
+import json
 import logging
+from collections.abc import Iterator, Sequence
 from pathlib import Path
+from typing import Any
 
+from arete.domain.constants import SQLITE_MAX_VARS
 from arete.domain.stats.models import CardStatsAggregate, FsrsMemoryState, ReviewEntry
 from arete.domain.stats.ports import StatsRepository
 from arete.infrastructure.anki.repository import AnkiRepository
@@ -13,6 +17,12 @@ from arete.infrastructure.anki.repository import AnkiRepository
 logger = logging.getLogger(__name__)
 
 
+def _chunked(ids: list[int]) -> Iterator[list[int]]:
+    """Yield id slices small enough to bind as SQL parameters in one query."""
+    for start in range(0, len(ids), SQLITE_MAX_VARS):
+        yield ids[start : start + SQLITE_MAX_VARS]
+
+
 class DirectStatsRepository(StatsRepository):
     """Fetches card statistics directly from Anki's SQLite database.
 
@@ -31,78 +41,100 @@ class DirectStatsRepository(StatsRepository):
         stats_list: list[CardStatsAggregate] = []
 
         with AnkiRepository(self.anki_base) as repo:
-            if not repo.col:
+            if not repo.col or repo.col.db is None:
                 logger.warning("Could not open Anki collection")
                 return []
 
-            for nid in nids:
-                try:
-                    cids = repo.col.find_cards(f"nid:{nid}")
-
-                    for cid in cids:
-                        card = repo.col.get_card(cid)
-                        deck = repo.col.decks.get(card.did)
-                        deck_name = deck["name"] if deck else "Unknown"
-
-                        # Extract FSRS memory state
-                        fsrs_state: FsrsMemoryState | None = None
-                        if hasattr(card, "memory_state") and card.memory_state:
-                            ms = card.memory_state
-                            difficulty = (
-                                ms.difficulty  # FSRS uses 1-10 scale natively
-                                if hasattr(ms, "difficulty")
-                                else None
-                            )
-                            stability = ms.stability if hasattr(ms, "stability") else None
-
-                            if stability is not None and difficulty is not None:
-                                fsrs_state = FsrsMemoryState(
-                                    stability=stability,
-                                    difficulty=difficulty,
-                                    retrievability=None,  # Computed by application layer
-                                )
-
-                        # Get last review time from revlog
-                        last_review = self._get_last_review_time(repo, cid)
-
-                        # Get front content
-                        front = None
-                        try:
-                            note = repo.col.get_note(card.nid)
-                            front = note.fields[0] if note.fields else None
-                        except Exception:
-                            pass
-
-                        # Get answer distribution from revlog
-                        answer_dist = self._get_answer_distribution(repo, cid)
-
-                        # Get average time
-                        avg_time = self._get_average_time(repo, cid)
+            # One join replaces the per-card find_cards/get_note/MAX(id) round trips.
+            # db.execute yields Sequence rows, not tuples, so annotate accordingly.
+            rows: list[Sequence[Any]] = []
+            try:
+                for chunk in _chunked(nids):
+                    placeholders = ",".join("?" * len(chunk))
+                    query = (
+                        "SELECT c.id, c.nid, c.did, c.lapses, c.factor, c.ivl, c.due, c.reps,"
+                        " n.flds, (SELECT MAX(id) FROM revlog r WHERE r.cid = c.id)"
+                        " FROM cards c JOIN notes n ON n.id = c.nid"
+                        f" WHERE c.nid IN ({placeholders})"
+                        " ORDER BY c.nid, c.ord"
+                    )
+                    rows.extend(repo.col.db.execute(query, *chunk))
+            except Exception as e:
+                logger.warning(f"Failed to fetch card stats: {e}")
+                return []
+
+            cids = [row[0] for row in rows]
+            deck_names = {d.id: d.name for d in repo.col.decks.all_names_and_ids()}
+            answer_dists = self._get_answer_distributions(repo, cids)
+            avg_times = self._get_average_times(repo, cids)
 
+            # Results follow caller order, like the old per-nid loop did.
+            rows_by_nid: dict[int, list[Sequence[Any]]] = {}
+            for row in rows:
+                rows_by_nid.setdefault(row[1], []).append(row)
+
+            for nid in nids:
+                for row in rows_by_nid.get(nid, []):
+                    try:
                         stats_list.append(
-                            CardStatsAggregate(
-                                card_id=card.id,
-                                note_id=card.nid,
-                                deck_name=deck_name,
-                                lapses=card.lapses,
-                                ease=card.factor,
-                                interval=card.ivl,
-                                due=card.due,
-                                reps=card.reps,
-                                fsrs=fsrs_state,
-                                last_review=last_review,
-                                average_time_ms=avg_time,
-                                reviews=[],  # Populated on demand via get_review_history
-                                front=front,
-                                answer_distribution=answer_dist,
-                            )
+                            self._build_aggregate(repo, row, deck_names, answer_dists, avg_times)
                         )
-
-                except Exception as e:
-                    logger.warning(f"Failed to fetch stats for nid={nid}: {e}")
+                    except Exception as e:
+                        logger.warning(f"Failed to fetch stats for nid={nid}: {e}")
 
         return stats_list
 
+    def _build_aggregate(
+        self,
+        repo: AnkiRepository,
+        row: Sequence[Any],
+        deck_names: dict[int, str],
+        answer_dists: dict[int, dict[int, int]],
+        avg_times: dict[int, int],
+    ) -> CardStatsAggregate:
+        """Assemble a CardStatsAggregate from one joined cards/notes row."""
+        cid, nid, did, lapses, factor, ivl, due, reps, flds, last_review_ms = row
+
+        # memory_state is only exposed on the Python card object, so this stays
+        # a per-card lookup — everything else comes from the batched queries.
+        fsrs_state: FsrsMemoryState | None = None
+        card = None
+        if repo.col:
+            try:
+                card = repo.col.get_card(cid)
+            except Exception:
+                pass
+        # getattr with a default instead of hasattr-then-access: one attribute
+        # walk per lookup in a loop that runs once per card.
+        ms = getattr(card, "memory_state", None)
+        if ms:
+            difficulty = getattr(ms, "difficulty", None)  # FSRS 1-10 scale natively
+            stability = getattr(ms, "stability", None)
+
+            if stability is not None and difficulty is not None:
+                fsrs_state = FsrsMemoryState(
+                    stability=stability,
+                    difficulty=difficulty,
+                    retrievability=None,  # Computed by application layer
+                )
+
+        return CardStatsAggregate(
+            card_id=cid,
+            note_id=nid,
+            deck_name=deck_names.get(did, "Unknown"),
+            lapses=lapses,
+            ease=factor,
+            interval=ivl,
+            due=due,
+            reps=reps,
+            fsrs=fsrs_state,
+            last_review=last_review_ms // 1000 if last_review_ms else None,
+            average_time_ms=avg_times.get(cid, 0),
+            reviews=[],  # Populated on demand via get_review_history
+            front=flds.split("\x1f", 1)[0] if flds else None,
+            answer_distribution=answer_dists.get(cid, {}),
+        )
+
     async def get_review_history(self, cids: list[int]) -> list[ReviewEntry]:
         """Fetch review history from the revlog table."""
         if not cids:
@@ -126,52 +158,71 @@ class DirectStatsRepository(StatsRepository):
             if has_data:
                 col_subset += ", data"
 
-            placeholders = ",".join("?" * len(cids))
-            query = f"SELECT {col_subset} FROM revlog WHERE cid IN ({placeholders}) ORDER BY id ASC"
-
             try:
-                import json
-
                 if repo.col.db is None:
                     return []
-                for row in repo.col.db.execute(query, *cids):
-                    # Indices:
-                    # 0: id, 1: cid, 2: ease, 3: ivl, 4: lastIvl, 5: time, 6: type
-                    # 7: data (if exists) via 'col_subset' length logic?
-
-                    data_idx = 7
-                    s_at_review = None
-                    d_at_review = None
-                    r_at_review = None
-
-                    if has_data and len(row) > data_idx and row[data_idx]:
-                        try:
-                            data = json.loads(row[data_idx])
-                            s_at_review = data.get("s")
-                            d_at_review = data.get("d")
-                            r_at_review = data.get("r")
-                        except Exception:
-                            pass
-
-                    entries.append(
-                        ReviewEntry(
-                            card_id=row[1],
-                            review_time=row[0] // 1000,
-                            rating=row[2],
-                            interval=row[3],
-                            last_interval=row[4],
-                            time_taken=row[5],
-                            review_type=row[6],
-                            stability=s_at_review,
-                            difficulty=d_at_review,
-                            retrievability=r_at_review,
-                        )
-                    )
+
+                rows = self._fetch_revlog_rows(repo, cids, col_subset)
+                entries = [self._review_entry(row, has_data) for row in rows]
             except Exception as e:
                 logger.warning(f"Failed to fetch review history: {e}")
 
         return entries
 
+    @staticmethod
+    def _fetch_revlog_rows(
+        repo: AnkiRepository, cids: list[int], col_subset: str
+    ) -> list[Sequence[Any]]:
+        """Fetch revlog rows for the given cids in bind-limit-sized chunks."""
+        if not repo.col or repo.col.db is None:
+            return []
+
+        rows: list[Sequence[Any]] = []
+        for chunk in _chunked(cids):
+            placeholders = ",".join("?" * len(chunk))
+            query = f"SELECT {col_subset} FROM revlog WHERE cid IN ({placeholders}) ORDER BY id ASC"
+            rows.extend(repo.col.db.execute(query, *chunk))
+
+        # Chunked queries are only sorted within a chunk; restore the
+        # global chronological order the single query used to give.
+        if len(cids) > SQLITE_MAX_VARS:
+            rows.sort(key=lambda r: r[0])
+        return rows
+
+    @staticmethod
+    def _review_entry(row: Sequence[Any], has_data: bool) -> ReviewEntry:
+        """Build a ReviewEntry from one revlog row.
+
+        Indices: 0: id, 1: cid, 2: ease, 3: ivl, 4: lastIvl, 5: time, 6: type,
+        7: data (only when the column exists in this collection).
+        """
+        data_idx = 7
+        s_at_review = None
+        d_at_review = None
+        r_at_review = None
+
+        if has_data and len(row) > data_idx and row[data_idx]:
+            try:
+                data = json.loads(row[data_idx])
+                s_at_review = data.get("s")
+                d_at_review = data.get("d")
+                r_at_review = data.get("r")
+            except Exception:
+                pass
+
+        return ReviewEntry(
+            card_id=row[1],
+            review_time=row[0] // 1000,
+            rating=row[2],
+            interval=row[3],
+            last_interval=row[4],
+            time_taken=row[5],
+            review_type=row[6],
+            stability=s_at_review,
+            difficulty=d_at_review,
+            retrievability=r_at_review,
+        )
+
     async def get_deck_params(self, deck_names: list[str]) -> dict[str, dict]:
         """Fetch FSRS parameters (desired retention, weights) for the given decks."""
         params: dict[str, dict] = {}
@@ -206,40 +257,43 @@ class DirectStatsRepository(StatsRepository):
 
         return params
 
-    def _get_answer_distribution(self, repo: AnkiRepository, cid: int) -> dict[int, int]:
-        """Get counts of each answer button rating for a card."""
+    def _get_answer_distributions(
+        self, repo: AnkiRepository, cids: list[int]
+    ) -> dict[int, dict[int, int]]:
+        """Get per-card counts of each answer button rating in one grouped query."""
         try:
-            if repo.col is None or repo.col.db is None:
+            if not cids or repo.col is None or repo.col.db is None:
                 return {}
 
-            dist: dict[int, int] = {}
-            query = "SELECT ease, COUNT(*) FROM revlog WHERE cid = ? GROUP BY ease"
-            for rating, count in repo.col.db.execute(query, cid):
-                dist[rating] = count
-            return dist
+            dists: dict[int, dict[int, int]] = {}
+            for chunk in _chunked(cids):
+                placeholders = ",".join("?" * len(chunk))
+                query = (
+                    "SELECT cid, ease, COUNT(*) FROM revlog"
+                    f" WHERE cid IN ({placeholders}) GROUP BY cid, ease"
+                )
+                for cid, rating, count in repo.col.db.execute(query, *chunk):
+                    dists.setdefault(cid, {})[rating] = count
+            return dists
         except Exception:
             return {}
 
-    def _get_last_review_time(self, repo: AnkiRepository, cid: int) -> int | None:
-        """Get the most recent review time for a card."""
+    def _get_average_times(self, repo: AnkiRepository, cids: list[int]) -> dict[int, int]:
+        """Get per-card average answer time (ms) in one grouped query."""
         try:
-            if repo.col is None or repo.col.db is None:
-                return None
-            result = repo.col.db.scalar("SELECT MAX(id) FROM revlog WHERE cid = ?", cid)
-            if result:
-                return result // 1000  # Convert ms to seconds
-        except Exception:
-            pass
-        return None
+            if not cids or repo.col is None or repo.col.db is None:
+                return {}
 
-    def _get_average_time(self, repo: AnkiRepository, cid: int) -> int:
-        """Get average time taken (ms) for a card."""
-        try:
-            if repo.col is None or repo.col.db is None:
-                return 0
             # time limit is usually capped at 60s (60000ms) in revlog logic but here we just avg
-            result = repo.col.db.scalar("SELECT AVG(time) FROM revlog WHERE cid = ?", cid)
-            return int(result) if result else 0
+            avgs: dict[int, int] = {}
+            for chunk in _chunked(cids):
+                placeholders = ",".join("?" * len(chunk))
+                query = (
+                    f"SELECT cid, AVG(time) FROM revlog WHERE cid IN ({placeholders}) GROUP BY cid"
+                )
+                for cid, avg in repo.col.db.execute(query, *chunk):
+                    if avg:
+                        avgs[cid] = int(avg)
+            return avgs
         except Exception:
-            pass
-        return 0
+            return {}
@@ -84,22 +84,46 @@ class AnkiRepository:
         try:
             self.col = Collection(str(path))
         except Exception as e:
-            # Restore CWD if init fails
-            os.chdir(self._saved_cwd)
             raise OSError(f"Could not open Anki collection at {path}: {e}") from e
+        finally:
+            # Restore CWD right away: the collection may stay open for a
+            # whole scope, and downstream stages (vault writes) must not run
+            # with CWD pointed at the Anki profile directory.
+            os.chdir(self._saved_cwd)
+
+        if os.environ.get("ARETE_DB_WAL") == "1":
+            self._tune_db()
 
         return self
 
+    def _tune_db(self) -> None:
+        """Apply concurrency-friendly SQLite PRAGMAs to the open collection.
+
+        WAL lets the stats reader run alongside the sync writer instead of
+        serializing on the journal. Opt-in via ARETE_DB_WAL=1 because WAL
+        leaves .anki2-wal/.anki2-shm sidecar files next to the collection.
+        """
+        if not self.col or self.col.db is None:
+            return
+        db = self.col.db
+        try:
+            mode = db.scalar("PRAGMA journal_mode")
+            if str(mode).lower() != "wal":
+                db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("PRAGMA temp_store=MEMORY")
+            db.execute("PRAGMA cache_size=-20000")
+            db.execute("PRAGMA mmap_size=268435456")
+        except Exception:
+            # Tuning is best-effort; never fail an open over a pragma.
+            pass
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit context manager and close the Anki collection."""
         if self.col:
             self.col.close()
             self.col = None
 
-        # Restore CWD
-        if hasattr(self, "_saved_cwd"):
-            os.chdir(self._saved_cwd)
-
     def find_notes(self, query: str) -> list[int]:
         """Return list of note IDs matching the query."""
         if not self.col:
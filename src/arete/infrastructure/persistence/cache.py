@@ -1,10 +1,32 @@
-import json
 import logging
 import sqlite3
 import threading
 from pathlib import Path
 from typing import Any
 
+# orjson usually arrives as a transitive dependency of the anki package. Its C
+# (de)serializer is ~5-10x faster than stdlib json for the meta dicts we
+# round-trip on every cache hit/write, and it reads legacy str rows fine. It is
+# not declared in pyproject though, so fall back to stdlib json when missing.
+try:
+    import orjson
+
+    def _meta_dumps(meta: dict[str, Any]) -> bytes:
+        # OPT_NON_STR_KEYS matches stdlib json's coercion of int keys to str.
+        return orjson.dumps(meta, option=orjson.OPT_NON_STR_KEYS)
+
+    def _meta_loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+except ImportError:  # pragma: no cover - depends on the installed anki extras
+    import json as _json
+
+    def _meta_dumps(meta: dict[str, Any]) -> bytes:
+        return _json.dumps(meta).encode()
+
+    def _meta_loads(data: bytes | str) -> Any:
+        return _json.loads(data)
+
 
 class ContentCache:
     def __init__(self, db_path: Path | None = None):
@@ -103,7 +125,7 @@ class ContentCache:
             row = cur.fetchone()
             if row:
                 try:
-                    res = json.loads(row[0])
+                    res = _meta_loads(row[0])
                     self.logger.debug(f"[cache] meta hit for {md_path.name}")
                     return res
                 except Exception:
@@ -129,7 +151,7 @@ class ContentCache:
             row = cur.fetchone()
             if row:
                 try:
-                    res = json.loads(row[0])
+                    res = _meta_loads(row[0])
                     self.logger.debug(f"[cache] stat-meta hit for {md_path.name}")
                     return res
                 except Exception:
@@ -144,7 +166,7 @@ class ContentCache:
         mtime: float = 0,
         size: int = 0,
     ):
-        json_str = json.dumps(meta)
+        json_str = _meta_dumps(meta)
         with self._lock:
             self._conn.execute(
                 "INSERT OR REPLACE INTO files (path, hash, mtime, size, meta_json) "
@@ -1,44 +1,123 @@
 """Arete CLI — root commands and subgroup registration."""
 
-import json
-import logging
-import os
 import sys
+from enum import Enum
 from pathlib import Path
-from typing import Annotated, Literal
+from typing import Annotated
 
 import typer
+from typer.core import MarkupMode
 
 from arete.application.config import resolve_config
 from arete.interface._common import _resolve_with_overrides
-from arete.interface.anki_commands import anki_app
-from arete.interface.serve_commands import serve_app
-from arete.interface.vault_commands import vault_app
 
 # ---------------------------------------------------------------------------
 # Root app
 # ---------------------------------------------------------------------------
 
+_SUBGROUPS = {
+    "vault": (
+        "arete.interface.vault_commands",
+        "vault_app",
+        "Vault maintenance: validate, fix, format.",
+    ),
+    "anki": ("arete.interface.anki_commands", "anki_app", "Anki card management and debugging."),
+    "serve": ("arete.interface.serve_commands", "serve_app", "Start Arete servers."),
+}
+
+# Commands handled entirely by this module; none of the heavy subgroups load.
+_ROOT_COMMANDS = frozenset({"sync", "init", "logs", "queue", "report", "config", "graph"})
+
+
+def _sniff_subcommand() -> str | None:
+    """Return the first non-flag CLI token, or None (bare/flag-only run)."""
+    return next((a for a in sys.argv[1:] if not a.startswith("-")), None)
+
+
+def _rich_markup_mode() -> MarkupMode:
+    """Rich help markup only when help can actually render.
+
+    Rich markup compilation is pure overhead for a real command run, where
+    no help text is ever shown. When the invocation isn't recognizably a
+    command run (e.g. a test runner driving the app object), keep full
+    fidelity.
+    """
+    argv = sys.argv[1:]
+    if not argv or "-h" in argv or "--help" in argv:
+        return "rich"
+    token = _sniff_subcommand()
+    if token in _SUBGROUPS or token in _ROOT_COMMANDS:
+        return None
+    return "rich"
+
+
 app = typer.Typer(
     help="arete: Pro-grade Obsidian to Anki sync tool.",
     no_args_is_help=True,
-    rich_markup_mode="rich",
+    rich_markup_mode=_rich_markup_mode(),
 )
 
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(levelname)s:%(name)s:%(message)s",
-    stream=sys.stderr,
-)
-logger = logging.getLogger(__name__)
+_LOG_CONFIGURED = False
+
+
+def _configure_logging() -> None:
+    """Set up root logging once, on first real command dispatch.
+
+    Deferred out of module import so fast-exit paths (--help, completion)
+    skip handler and stream setup entirely.
+    """
+    global _LOG_CONFIGURED
+    if _LOG_CONFIGURED:
+        return
+    _LOG_CONFIGURED = True
+
+    import logging
+
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(levelname)s:%(name)s:%(message)s",
+            stream=sys.stderr,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Subgroup registration
+#
+# The vault/anki/serve command modules (and their transitive imports) dominate
+# CLI cold-start, so they are only imported when the invocation actually
+# targets them. Everything else gets an empty stub Typer carrying the same
+# help text, which keeps `arete --help` listing all groups.
+# ---------------------------------------------------------------------------
+
 
-app.add_typer(vault_app, name="vault")
-app.add_typer(anki_app, name="anki")
-app.add_typer(serve_app, name="serve")
+def _register_subgroups() -> None:
+    token = _sniff_subcommand()
+    if token in _SUBGROUPS:
+        load = {token}
+    elif token is None or token in _ROOT_COMMANDS:
+        load = set()
+    else:
+        # Unrecognized token — e.g. a test runner driving the app object
+        # directly, where sys.argv says nothing about the invocation.
+        # Correctness first: load everything.
+        load = set(_SUBGROUPS)
+
+    import importlib
+
+    for name, (module, attr, help_text) in _SUBGROUPS.items():
+        if name in load:
+            sub = getattr(importlib.import_module(module), attr)
+        else:
+            sub = typer.Typer(help=help_text)
+        app.add_typer(sub, name=name)
+
+
+_register_subgroups()
 
 config_app = typer.Typer(help="Manage arete configuration.")
 app.add_typer(config_app, name="config")
@@ -52,6 +131,14 @@ app.add_typer(graph_app, name="graph")
 # ---------------------------------------------------------------------------
 
 
+def _version_callback(value: bool) -> None:
+    if value:
+        from arete.interface.entry import _version_string
+
+        typer.echo(_version_string())
+        raise typer.Exit()
+
+
 @app.callback()
 def main_callback(
     ctx: typer.Context,
@@ -61,8 +148,19 @@ def main_callback(
             "--verbose", "-v", count=True, help="Increase verbosity. Repeat for more detail."
         ),
     ] = 1,
+    version: Annotated[
+        bool,
+        typer.Option(
+            "--version",
+            "-V",
+            callback=_version_callback,
+            is_eager=True,
+            help="Show version and exit.",
+        ),
+    ] = False,
 ):
     """Global settings for arete."""
+    _configure_logging()
     ctx.ensure_object(dict)
     ctx.obj["verbose_bonus"] = verbose
 
@@ -72,6 +170,17 @@ def main_callback(
 # ---------------------------------------------------------------------------
 
 
+class Algo(str, Enum):
+    """Queue-building algorithm.
+
+    Typer maps enums straight to a Click Choice, skipping the generic
+    Literal introspection path.
+    """
+
+    static = "static"
+    dynamic = "dynamic"
+
+
 @app.command()
 def sync(
     ctx: typer.Context,
@@ -152,6 +261,8 @@ def logs():
     if sys.platform == "darwin":
         subprocess.run(["open", str(config.log_dir)])
     elif sys.platform == "win32":
+        import os
+
         os.startfile(str(config.log_dir))
     else:
         subprocess.run(["xdg-open", str(config.log_dir)])
@@ -186,7 +297,7 @@ def queue(
         ),
     ] = False,
     algo: Annotated[
-        Literal["static", "dynamic"],
+        Algo,
         typer.Option(
             "--algo",
             help=(
@@ -195,7 +306,7 @@ def queue(
                 "'dynamic' = ready-frontier ordering for prerequisite-aware sequencing."
             ),
         ),
-    ] = "static",
+    ] = Algo.static,
 ):
     """Build a dependency-sorted filtered deck in Anki.
 
@@ -230,7 +341,7 @@ def queue(
 
     async def run():
         anki = await get_anki_bridge(config)
-        try:
+        async with anki:
             result = await build_study_queue(
                 anki,
                 vault_root,
@@ -239,7 +350,7 @@ def queue(
                 include_new=include_new,
                 include_related=include_related,
                 cross_deck=cross_deck,
-                algo=algo,
+                algo=algo.value,
                 dry_run=dry_run,
                 enrich=False,
             )
@@ -257,7 +368,7 @@ def queue(
                 )
 
             typer.echo(f"Due cards: {result.due_count} ({result.unmapped_count} without Arete IDs)")
-            typer.echo(f"Algorithm: {algo}")
+            typer.echo(f"Algorithm: {algo.value}")
             if result.prereq_count:
                 typer.echo(f"Weak prerequisites: {result.prereq_count}")
             typer.echo(f"Main queue: {result.main_count}")
@@ -273,8 +384,6 @@ def queue(
                 )
             elif not dry_run and result.total_queued > 0 and not result.deck_created:
                 typer.secho("Failed to create filtered deck.", fg="red")
-        finally:
-            await anki.close()
 
     asyncio.run(run())
 
@@ -321,10 +430,8 @@ def report(
 
             async def unsuspend():
                 anki = await get_anki_bridge(config)
-                try:
+                async with anki:
                     return await anki.unsuspend_cards(to_unsuspend)
-                finally:
-                    await anki.close()
 
             try:
                 asyncio.run(unsuspend())
@@ -347,6 +454,8 @@ def report(
         return
 
     if json_output:
+        import json
+
         typer.echo(json.dumps(reports, indent=2, ensure_ascii=False))
         return
 
@@ -378,6 +487,8 @@ def report(
 @config_app.command("show")
 def config_show():
     """Display final resolved configuration."""
+    import json
+
     config = resolve_config()
     d = {k: str(v) if isinstance(v, Path) else v for k, v in config.model_dump().items()}
     typer.echo(json.dumps(d, indent=2))
@@ -396,6 +507,8 @@ def config_open():
     if sys.platform == "darwin":
         subprocess.run(["open", str(cfg_path)])
     elif sys.platform == "win32":
+        import os
+
         os.startfile(str(cfg_path))
     else:
         subprocess.run(["xdg-open", str(cfg_path)])
@@ -425,7 +538,12 @@ def graph_check(
     result = check_graph_health(vault_root)
 
     if json_output:
-        typer.echo(json.dumps(asdict(result), indent=2))
+        import json
+
+        # Stream straight to stdout: no second full copy of the report as a
+        # formatted string, which matters for vaults with thousands of nodes.
+        json.dump(asdict(result), sys.stdout, indent=2)
+        sys.stdout.write("\n")
     else:
         typer.echo(
             f"Nodes: {result.total_nodes}  Edges: {result.total_edges}"
@@ -0,0 +1,24 @@
+"""Console entry point with a pre-Typer fast path for trivial invocations.
+
+`arete --version` answers straight from package metadata without importing
+typer or building the command tree; everything else goes through the app.
+"""
+
+import sys
+
+
+def _version_string() -> str:
+    from importlib.metadata import version
+
+    return f"arete {version('arete')}"
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    if len(argv) == 1 and argv[0] in {"-V", "--version"}:
+        print(_version_string())
+        return
+
+    from arete.interface.cli import app
+
+    app()
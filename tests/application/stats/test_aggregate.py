@@ -0,0 +1,19 @@
+import statistics
+
+import pytest
+
+from arete.application.stats.aggregate import triple_of, variance_of
+
+
+def test_triple_of_matches_pvariance():
+    values = [1.0, 2.5, 3.0, 7.5, 9.0]
+    n, mean, _ = triple_of(values)
+    assert n == len(values)
+    assert mean == pytest.approx(statistics.fmean(values))
+    assert variance_of(triple_of(values)) == pytest.approx(statistics.pvariance(values))
+
+
+def test_variance_of_small_samples():
+    assert variance_of(triple_of([])) is None
+    assert variance_of(triple_of([3.0])) is None
+    assert variance_of(triple_of([3.0, 3.0])) == pytest.approx(0.0)
@@ -18,6 +18,16 @@ def pytest_collection_modifyitems(items):
             item.add_marker(pytest.mark.integration)
 
 
+@pytest.fixture(autouse=True)
+def _clear_factory_cache():
+    """Reset the factory's memoized AnkiConnect probe between tests."""
+    from arete.application.factory import clear_factory_cache
+
+    clear_factory_cache()
+    yield
+    clear_factory_cache()
+
+
 # --- Global Config ---
 
 
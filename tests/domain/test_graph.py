@@ -144,6 +144,20 @@ class TestDependencyGraphRequires:
         dependents = g.get_dependents("A")
         assert set(dependents) == {"B", "C"}
 
+    def test_has_prerequisites_and_dependents(self):
+        """has_* mirror the get_* truthiness without building lists."""
+        g = DependencyGraph()
+        g.add_node(_make_node("A"))
+        g.add_node(_make_node("B"))
+        g.add_requires("A", "B")  # A requires B
+
+        assert g.has_prerequisites("A")
+        assert not g.has_prerequisites("B")
+        assert g.has_dependents("B")
+        assert not g.has_dependents("A")
+        assert not g.has_prerequisites("missing")
+        assert not g.has_dependents("missing")
+
     def test_prerequisites_and_dependents_inverse(self):
         """get_prerequisites and get_dependents are inverses."""
         g = DependencyGraph()
@@ -20,7 +20,17 @@ import respx
 from httpx import Response
 
 from arete.domain.models import AnkiNote, WorkItem
-from arete.infrastructure.adapters.anki_connect import AnkiConnectAdapter
+from arete.infrastructure.adapters.anki_connect import AnkiConnectAdapter, _is_wsl, _wsl_host_ip
+
+
+@pytest.fixture(autouse=True)
+def _reset_wsl_detection_cache():
+    """WSL detection is cached per process; tests patch uname/resolv.conf."""
+    _is_wsl.cache_clear()
+    _wsl_host_ip.cache_clear()
+    yield
+    _is_wsl.cache_clear()
+    _wsl_host_ip.cache_clear()
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -273,11 +283,12 @@ async def test_suspend_cards_fail():
 
 @pytest.mark.asyncio
 async def test_invoke_error_handling():
-    adapter = AnkiConnectAdapter()
+    # Patch before construction: the adapter builds its pooled client eagerly.
     with patch("httpx.AsyncClient") as mock_client_cls:
         mock_client = AsyncMock()
         mock_client_cls.return_value = mock_client
         mock_client.post.side_effect = Exception("Network Error")
+        adapter = AnkiConnectAdapter()
 
         with pytest.raises(Exception, match="Network Error"):
             await adapter._invoke("version")
@@ -431,13 +442,10 @@ async def test_sync_notes_update_existing_with_tags_and_move(adapter_localhost):
                         "error": None,
                     },
                 ),
-                httpx.Response(200, json={"result": None, "error": None}),  # updateNoteFields
-                httpx.Response(200, json={"result": None, "error": None}),  # addTags
-                httpx.Response(200, json={"result": None, "error": None}),  # removeTags
+                # updateNoteFields + addTags + removeTags + changeDeck in one multi
                 httpx.Response(
-                    200, json={"result": [{"cards": [456]}], "error": None}
-                ),  # cards move check
-                httpx.Response(200, json={"result": None, "error": None}),  # changeDeck
+                    200, json={"result": [None, None, None, None], "error": None}
+                ),  # multi
             ]
         )
 
@@ -618,28 +626,78 @@ async def test_sync_notes_calls_ensure_model(adapter):
     respx.post("http://mock-anki:8765").mock(
         side_effect=[
             Response(200, json={"result": None, "error": None}),  # createDeck
+            # Fetched once by ensure_model_has_source_field and reused from
+            # _model_fields_cache by _populate_nid_field — no second fetch.
             Response(
-                200, json={"result": ["Front", "Back", "_obsidian_source"], "error": None}
+                200,
+                json={"result": ["Front", "Back", "nid", "_obsidian_source"], "error": None},
             ),  # modelFieldNames
             Response(200, json={"result": [], "error": None}),  # findNotes
             Response(200, json={"result": 123, "error": None}),  # addNote
+            # notesInfo + updateNoteFields share one multi round-trip
             Response(
-                200, json={"result": [{"noteId": 123, "cards": [456]}], "error": None}
-            ),  # notesInfo
-            Response(
-                200, json={"result": ["Front", "Back", "nid"], "error": None}
-            ),  # modelFieldNames
-            Response(200, json={"result": None, "error": None}),  # updateNoteFields
+                200,
+                json={"result": [[{"noteId": 123, "cards": [456]}], None], "error": None},
+            ),  # multi
         ]
     )
 
     results = await adapter.sync_notes([item])
     assert results[0].ok is True
-    assert len(respx.calls) == 7
+    assert len(respx.calls) == 5
     assert "addNote" in respx.calls[3].request.content.decode()
     assert results[0].new_cid == "456"
 
 
+# ---------------------------------------------------------------------------
+# sync_notes — batched nid probe (multi)
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_sync_notes_batches_nid_probes(adapter):
+    """Batches with several claimed nids probe them in one multi call."""
+    items = []
+    for idx, nid in enumerate(["111", "222"], start=1):
+        note = AnkiNote(
+            model="Basic",
+            deck="Default",
+            fields={"Front": f"Q{idx}", "Back": "A"},
+            tags=[],
+            start_line=1,
+            end_line=2,
+            source_file=Path("test.md"),
+            source_index=idx,
+            nid=nid,
+        )
+        items.append(WorkItem(note=note, source_file=Path("test.md"), source_index=idx))
+
+    calls = []
+
+    async def fake_invoke(action, **params):
+        sub_actions = [a["action"] for a in params["actions"]] if action == "multi" else None
+        calls.append(sub_actions[0] if sub_actions else action)
+        if sub_actions == ["notesInfo", "notesInfo"]:
+            return [
+                {"result": [{"noteId": 111, "tags": [], "cards": [10]}], "error": None},
+                {"result": [{"noteId": 222, "tags": [], "cards": [20]}], "error": None},
+            ]
+        if sub_actions == ["updateNoteFields", "changeDeck"]:
+            return [None, None]
+        raise AssertionError(f"unexpected action {action} ({sub_actions})")
+
+    with (
+        patch.object(adapter, "ensure_deck", return_value=True),
+        patch.object(adapter, "ensure_model_has_source_field", return_value=True),
+        patch.object(adapter, "_invoke", side_effect=fake_invoke),
+    ):
+        results = await adapter.sync_notes(items)
+
+    assert all(r.ok for r in results)
+    assert sorted(r.new_nid for r in results) == ["111", "222"]
+    assert calls.count("notesInfo") == 1  # one batched probe, no per-item probes
+
+
 # ---------------------------------------------------------------------------
 # get_deck_names
 # ---------------------------------------------------------------------------
@@ -915,16 +973,30 @@ def test_wsl_detection_failed_read():
 
 
 @pytest.mark.asyncio
-async def test_wsl_detection_curl_found():
-    """WSL with curl.exe found — uses curl bridge and 127.0.0.1."""
+async def test_wsl_detection_curl_opt_in():
+    """WSL with ARETE_WSL_CURL=1 and curl.exe found — uses curl bridge and 127.0.0.1."""
     with patch("platform.uname") as mock_uname:
         mock_uname.return_value.release = "microsoft-standard-WSL2"
         with patch("shutil.which", return_value="/mnt/c/Windows/System32/curl.exe"):
-            ac = AnkiConnectAdapter(url="http://localhost:8765")
+            with patch.dict(os.environ, {"ARETE_WSL_CURL": "1"}):
+                ac = AnkiConnectAdapter(url="http://localhost:8765")
             assert ac.use_windows_curl is True
             assert ac.url == "http://127.0.0.1:8765"
 
 
+@pytest.mark.asyncio
+async def test_wsl_curl_not_used_by_default():
+    """WSL with curl.exe present but no opt-in flag — pooled httpx over host IP."""
+    mock_resolv = "nameserver 172.17.0.1\n"
+    with patch("platform.uname") as mock_uname:
+        mock_uname.return_value.release = "microsoft-standard-WSL2"
+        with patch("shutil.which", return_value="/mnt/c/Windows/System32/curl.exe"):
+            with patch("builtins.open", mock_open(read_data=mock_resolv)):
+                ac = AnkiConnectAdapter(url="http://localhost:8765")
+            assert ac.use_windows_curl is False
+            assert ac.url == "http://172.17.0.1:8765"
+
+
 # ---------------------------------------------------------------------------
 # curl bridge
 # ---------------------------------------------------------------------------
@@ -932,13 +1004,14 @@ async def test_wsl_detection_curl_found():
 
 @pytest.mark.asyncio
 async def test_curl_bridge_active():
-    """Verify that we use curl.exe when available on WSL."""
+    """Verify that we use curl.exe when opted in via ARETE_WSL_CURL=1 on WSL."""
     mock_uname = "Linux 5.10.16.3-microsoft-standard-WSL2"
 
     with (
         patch("platform.uname") as mock_platform,
         patch("shutil.which") as mock_which,
         patch("asyncio.create_subprocess_exec") as mock_exec,
+        patch.dict(os.environ, {"ARETE_WSL_CURL": "1"}),
     ):
         mock_platform.return_value.release = mock_uname
         mock_which.side_effect = (
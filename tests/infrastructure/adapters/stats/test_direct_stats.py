@@ -34,6 +34,29 @@ def _make_card(cid=101, nid=1, lapses=0, factor=2500, ivl=10, due=0, reps=5, did
     return card
 
 
+def _stat_row(
+    cid=101, nid=1, did=1, lapses=0, factor=2500, ivl=10, due=0, reps=5, flds="Q", last_review=None
+):
+    """Build a row from the batched cards/notes join in get_card_stats."""
+    return (cid, nid, did, lapses, factor, ivl, due, reps, flds, last_review)
+
+
+def _wire_stats(mock_repo, rows, deck_names=None, dists=(), avgs=()):
+    """Wire the mocked collection for the batched get_card_stats queries.
+
+    db.execute is called three times: the cards/notes join, the answer
+    distribution GROUP BY, and the average time GROUP BY.
+    """
+    decks = []
+    for did, name in (deck_names or {1: "Default"}).items():
+        deck = MagicMock()
+        deck.id = did
+        deck.name = name
+        decks.append(deck)
+    mock_repo.col.decks.all_names_and_ids.return_value = decks
+    mock_repo.col.db.execute.side_effect = [rows, list(dists), list(avgs)]
+
+
 # ---------- get_card_stats ----------
 
 
@@ -57,18 +80,18 @@ async def test_get_card_stats_no_collection(mock_repo):
 @pytest.mark.asyncio
 async def test_get_card_stats_basic(mock_repo):
     """Basic stats fetching with a single NID."""
-    card = _make_card(cid=101, nid=1, lapses=3, factor=2500, ivl=14, due=1700000000, reps=20)
-    mock_repo.col.find_cards.return_value = [101]
-    mock_repo.col.get_card.return_value = card
-    mock_repo.col.decks.get.return_value = {"name": "Science"}
-
-    note = MagicMock()
-    note.fields = ["What is DNA?", "Deoxyribonucleic acid"]
-    mock_repo.col.get_note.return_value = note
-
-    # Mock helper queries (revlog)
-    mock_repo.col.db.scalar.return_value = None
-    mock_repo.col.db.execute.return_value = []
+    row = _stat_row(
+        cid=101,
+        nid=1,
+        lapses=3,
+        factor=2500,
+        ivl=14,
+        due=1700000000,
+        reps=20,
+        flds="What is DNA?\x1fDeoxyribonucleic acid",
+    )
+    _wire_stats(mock_repo, [row], deck_names={1: "Science"})
+    mock_repo.col.get_card.return_value = _make_card(cid=101, nid=1)
 
     repo = DirectStatsRepository(anki_base=None)
     result = await repo.get_card_stats([1])
@@ -96,12 +119,8 @@ async def test_get_card_stats_with_fsrs_memory_state(mock_repo):
     ms.stability = 30.0
     card.memory_state = ms
 
-    mock_repo.col.find_cards.return_value = [201]
+    _wire_stats(mock_repo, [_stat_row(cid=201, nid=2)])
     mock_repo.col.get_card.return_value = card
-    mock_repo.col.decks.get.return_value = {"name": "Default"}
-    mock_repo.col.get_note.return_value = MagicMock(fields=["Q"])
-    mock_repo.col.db.scalar.return_value = None
-    mock_repo.col.db.execute.return_value = []
 
     repo = DirectStatsRepository(anki_base=None)
     result = await repo.get_card_stats([2])
@@ -121,12 +140,8 @@ async def test_get_card_stats_fsrs_missing_difficulty(mock_repo):
     ms = MagicMock(spec=[])  # Empty spec, no attributes
     card.memory_state = ms
 
-    mock_repo.col.find_cards.return_value = [301]
+    _wire_stats(mock_repo, [_stat_row(cid=301, nid=3)])
     mock_repo.col.get_card.return_value = card
-    mock_repo.col.decks.get.return_value = {"name": "Default"}
-    mock_repo.col.get_note.return_value = MagicMock(fields=["Q"])
-    mock_repo.col.db.scalar.return_value = None
-    mock_repo.col.db.execute.return_value = []
 
     repo = DirectStatsRepository(anki_base=None)
     result = await repo.get_card_stats([3])
@@ -144,12 +159,8 @@ async def test_get_card_stats_fsrs_none_values(mock_repo):
     ms.stability = None
     card.memory_state = ms
 
-    mock_repo.col.find_cards.return_value = [401]
+    _wire_stats(mock_repo, [_stat_row(cid=401, nid=4)])
     mock_repo.col.get_card.return_value = card
-    mock_repo.col.decks.get.return_value = {"name": "Default"}
-    mock_repo.col.get_note.return_value = MagicMock(fields=["Q"])
-    mock_repo.col.db.scalar.return_value = None
-    mock_repo.col.db.execute.return_value = []
 
     repo = DirectStatsRepository(anki_base=None)
     result = await repo.get_card_stats([4])
@@ -159,14 +170,9 @@ async def test_get_card_stats_fsrs_none_values(mock_repo):
 
 @pytest.mark.asyncio
 async def test_get_card_stats_deck_missing(mock_repo):
-    """When deck lookup returns None, deck_name is 'Unknown'."""
-    card = _make_card(cid=501, nid=5, did=9999)
-    mock_repo.col.find_cards.return_value = [501]
-    mock_repo.col.get_card.return_value = card
-    mock_repo.col.decks.get.return_value = None
-    mock_repo.col.get_note.return_value = MagicMock(fields=["Q"])
-    mock_repo.col.db.scalar.return_value = None
-    mock_repo.col.db.execute.return_value = []
+    """When the deck id has no name entry, deck_name is 'Unknown'."""
+    _wire_stats(mock_repo, [_stat_row(cid=501, nid=5, did=9999)])
+    mock_repo.col.get_card.return_value = _make_card(cid=501, nid=5, did=9999)
 
     repo = DirectStatsRepository(anki_base=None)
     result = await repo.get_card_stats([5])
@@ -176,14 +182,9 @@ async def test_get_card_stats_deck_missing(mock_repo):
 
 @pytest.mark.asyncio
 async def test_get_card_stats_note_fields_empty(mock_repo):
-    """When note has empty fields list, front is None."""
-    card = _make_card(cid=601, nid=6)
-    mock_repo.col.find_cards.return_value = [601]
-    mock_repo.col.get_card.return_value = card
-    mock_repo.col.decks.get.return_value = {"name": "Default"}
-    mock_repo.col.get_note.return_value = MagicMock(fields=[])
-    mock_repo.col.db.scalar.return_value = None
-    mock_repo.col.db.execute.return_value = []
+    """When the note has no field content, front is None."""
+    _wire_stats(mock_repo, [_stat_row(cid=601, nid=6, flds="")])
+    mock_repo.col.get_card.return_value = _make_card(cid=601, nid=6)
 
     repo = DirectStatsRepository(anki_base=None)
     result = await repo.get_card_stats([6])
@@ -192,52 +193,46 @@ async def test_get_card_stats_note_fields_empty(mock_repo):
 
 
 @pytest.mark.asyncio
-async def test_get_card_stats_note_error_handled(mock_repo):
-    """Exception when fetching note doesn't crash; front is None."""
-    card = _make_card(cid=701, nid=7)
-    mock_repo.col.find_cards.return_value = [701]
-    mock_repo.col.get_card.return_value = card
-    mock_repo.col.decks.get.return_value = {"name": "Default"}
-    mock_repo.col.get_note.side_effect = Exception("Note not found")
-    mock_repo.col.db.scalar.return_value = None
-    mock_repo.col.db.execute.return_value = []
+async def test_get_card_stats_card_error_handled(mock_repo):
+    """Exception when fetching the card object doesn't crash; fsrs is None."""
+    _wire_stats(mock_repo, [_stat_row(cid=701, nid=7)])
+    mock_repo.col.get_card.side_effect = Exception("Card not found")
 
     repo = DirectStatsRepository(anki_base=None)
     result = await repo.get_card_stats([7])
 
-    assert result[0].front is None
+    assert len(result) == 1
+    assert result[0].fsrs is None
 
 
 @pytest.mark.asyncio
 async def test_get_card_stats_last_review_from_revlog(mock_repo):
-    """Last review time is extracted from revlog MAX(id)."""
-    card = _make_card(cid=801, nid=8)
-    mock_repo.col.find_cards.return_value = [801]
-    mock_repo.col.get_card.return_value = card
-    mock_repo.col.decks.get.return_value = {"name": "Default"}
-    mock_repo.col.get_note.return_value = MagicMock(fields=["Q"])
+    """Last review time comes from the MAX(revlog.id) join column."""
     # MAX(id) from revlog (ms timestamp) -> divided by 1000
-    mock_repo.col.db.scalar.side_effect = [1700000000000, 5000]  # last_review, avg_time
-    mock_repo.col.db.execute.return_value = []  # answer_distribution
+    _wire_stats(
+        mock_repo,
+        [_stat_row(cid=801, nid=8, last_review=1700000000000)],
+        avgs=[(801, 5000)],
+    )
+    mock_repo.col.get_card.return_value = _make_card(cid=801, nid=8)
 
     repo = DirectStatsRepository(anki_base=None)
     result = await repo.get_card_stats([8])
 
     assert result[0].last_review == 1700000000  # ms -> seconds
+    assert result[0].average_time_ms == 5000
 
 
 @pytest.mark.asyncio
 async def test_get_card_stats_answer_distribution(mock_repo):
-    """Answer distribution is correctly built from revlog grouping."""
-    card = _make_card(cid=901, nid=9)
-    mock_repo.col.find_cards.return_value = [901]
-    mock_repo.col.get_card.return_value = card
-    mock_repo.col.decks.get.return_value = {"name": "Default"}
-    mock_repo.col.get_note.return_value = MagicMock(fields=["Q"])
-    mock_repo.col.db.scalar.return_value = None
-
-    # answer_distribution query returns tuples (ease, count)
-    mock_repo.col.db.execute.return_value = [(1, 2), (3, 10), (4, 5)]
+    """Answer distribution is correctly built from the grouped revlog query."""
+    # answer_distribution query returns tuples (cid, ease, count)
+    _wire_stats(
+        mock_repo,
+        [_stat_row(cid=901, nid=9)],
+        dists=[(901, 1, 2), (901, 3, 10), (901, 4, 5)],
+    )
+    mock_repo.col.get_card.return_value = _make_card(cid=901, nid=9)
 
     repo = DirectStatsRepository(anki_base=None)
     result = await repo.get_card_stats([9])
@@ -251,15 +246,14 @@ async def test_get_card_stats_answer_distribution(mock_repo):
 @pytest.mark.asyncio
 async def test_get_card_stats_multiple_cards_per_note(mock_repo):
     """A note with multiple cards returns stats for each card."""
-    card_a = _make_card(cid=1001, nid=10)
-    card_b = _make_card(cid=1002, nid=10, lapses=1)
-
-    mock_repo.col.find_cards.return_value = [1001, 1002]
-    mock_repo.col.get_card.side_effect = [card_a, card_b]
-    mock_repo.col.decks.get.return_value = {"name": "Default"}
-    mock_repo.col.get_note.return_value = MagicMock(fields=["Q"])
-    mock_repo.col.db.scalar.return_value = None
-    mock_repo.col.db.execute.return_value = []
+    _wire_stats(
+        mock_repo,
+        [_stat_row(cid=1001, nid=10), _stat_row(cid=1002, nid=10, lapses=1)],
+    )
+    mock_repo.col.get_card.side_effect = [
+        _make_card(cid=1001, nid=10),
+        _make_card(cid=1002, nid=10, lapses=1),
+    ]
 
     repo = DirectStatsRepository(anki_base=None)
     result = await repo.get_card_stats([10])
@@ -271,22 +265,26 @@ async def test_get_card_stats_multiple_cards_per_note(mock_repo):
 
 
 @pytest.mark.asyncio
-async def test_get_card_stats_error_per_nid_handled(mock_repo):
-    """Exception on one NID doesn't prevent others from being fetched."""
-    mock_repo.col.find_cards.side_effect = [Exception("bad nid"), [201]]
+async def test_get_card_stats_preserves_nid_order(mock_repo):
+    """Results follow the caller's NID order, not the row order."""
+    _wire_stats(mock_repo, [_stat_row(cid=101, nid=1), _stat_row(cid=201, nid=2)])
+    mock_repo.col.get_card.return_value = _make_card()
+
+    repo = DirectStatsRepository(anki_base=None)
+    result = await repo.get_card_stats([2, 1])
+
+    assert [s.card_id for s in result] == [201, 101]
 
-    card = _make_card(cid=201, nid=2)
-    mock_repo.col.get_card.return_value = card
-    mock_repo.col.decks.get.return_value = {"name": "Default"}
-    mock_repo.col.get_note.return_value = MagicMock(fields=["Q2"])
-    mock_repo.col.db.scalar.return_value = None
-    mock_repo.col.db.execute.return_value = []
+
+@pytest.mark.asyncio
+async def test_get_card_stats_query_error_returns_empty(mock_repo):
+    """Exception on the batched query returns an empty list instead of raising."""
+    mock_repo.col.db.execute.side_effect = Exception("db locked")
 
     repo = DirectStatsRepository(anki_base=None)
     result = await repo.get_card_stats([1, 2])
 
-    assert len(result) == 1
-    assert result[0].card_id == 201
+    assert result == []
 
 
 # ---------- get_review_history ----------
@@ -372,6 +370,32 @@ async def test_get_review_history_with_fsrs_data(mock_repo):
     assert result[0].retrievability == 0.92
 
 
+@pytest.mark.asyncio
+async def test_get_review_history_chunks_large_cid_lists(mock_repo):
+    """CID lists beyond SQLite's parameter limit are split across queries."""
+    pragma = [
+        (0, "id", "", 0, None, 0),
+        (1, "cid", "", 0, None, 0),
+        (2, "ease", "", 0, None, 0),
+        (3, "ivl", "", 0, None, 0),
+        (4, "lastIvl", "", 0, None, 0),
+        (5, "time", "", 0, None, 0),
+        (6, "type", "", 0, None, 0),
+    ]
+    mock_repo.col.db.execute.side_effect = [
+        pragma,
+        [(1700000000000, 1, 3, 7, 1, 5000, 1)],
+        [(1690000000000, 950, 2, 1, 0, 8000, 0)],
+    ]
+
+    repo = DirectStatsRepository(anki_base=None)
+    result = await repo.get_review_history(list(range(1, 1001)))
+
+    assert mock_repo.col.db.execute.call_count == 3  # PRAGMA + 2 chunks
+    # Rows are re-sorted into global chronological order across chunks
+    assert [e.review_time for e in result] == [1690000000, 1700000000]
+
+
 # ---------- get_deck_params ----------
 
 
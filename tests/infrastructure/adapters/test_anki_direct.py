@@ -30,6 +30,8 @@ def mock_repo():
     with patch("arete.infrastructure.adapters.anki_direct.AnkiRepository") as mock:
         mock_instance = mock.return_value
         mock_instance.__enter__.return_value = mock_instance
+        # Like the real DBProxy, transact(op) runs the operation
+        mock_instance.col.db.transact.side_effect = lambda op: op()
         yield mock_instance
 
 
@@ -442,10 +444,12 @@ async def test_get_card_stats_success(adapter, mock_repo):
     mock_card.did = 1
     mock_card.memory_state = None  # no FSRS
 
-    mock_deck = {"name": "TestDeck"}
-    mock_repo.col.find_cards.return_value = [1001]
+    mock_deck = MagicMock()
+    mock_deck.id = 1
+    mock_deck.name = "TestDeck"
+    mock_repo.col.db.execute.return_value = [(500, 1001)]
     mock_repo.col.get_card.return_value = mock_card
-    mock_repo.col.decks.get.return_value = mock_deck
+    mock_repo.col.decks.all_names_and_ids.return_value = [mock_deck]
 
     mock_note = MagicMock()
     mock_note.fields = ["Front text"]
@@ -467,7 +471,8 @@ async def test_get_card_stats_success(adapter, mock_repo):
 @pytest.mark.asyncio
 async def test_get_card_stats_exception_returns_empty(adapter, mock_repo):
     """When get_card raises, return empty list (card-level exception handling)."""
-    mock_repo.col.find_cards.side_effect = Exception("Card fail")
+    mock_repo.col.db.execute.return_value = [(999, 1)]
+    mock_repo.col.get_card.side_effect = Exception("Card fail")
     res = await adapter.get_card_stats([999])
     assert res == []
 
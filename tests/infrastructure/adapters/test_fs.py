@@ -1,6 +1,6 @@
 from unittest.mock import patch
 
-from arete.application.utils.fs import file_md5, iter_markdown_files
+from arete.application.utils.fs import file_md5, iter_markdown_files, read_frontmatter_only
 
 
 def test_iter_markdown_files_simple(tmp_path):
@@ -111,3 +111,30 @@ def test_file_md5(tmp_path):
     f.write_text("hello world!")
     h2 = file_md5(f)
     assert h1 != h2
+
+
+def test_read_frontmatter_only_small_file(tmp_path):
+    """Files smaller than the chunk are returned whole."""
+    f = tmp_path / "small.md"
+    f.write_text("---\narete: true\n---\nbody\n", encoding="utf-8")
+
+    assert read_frontmatter_only(f) == "---\narete: true\n---\nbody\n"
+
+
+def test_read_frontmatter_only_truncates_long_body(tmp_path):
+    """Large files are cut right after the closing frontmatter marker."""
+    f = tmp_path / "large.md"
+    f.write_text("---\narete: true\n---\n" + "x" * 100_000, encoding="utf-8")
+
+    header = read_frontmatter_only(f, max_bytes=4096)
+
+    assert header == "---\narete: true\n---\n"
+
+
+def test_read_frontmatter_only_falls_back_without_closing_marker(tmp_path):
+    """When the closing --- is outside the chunk, the full file is returned."""
+    body = "no frontmatter here " * 10_000
+    f = tmp_path / "plain.md"
+    f.write_text(body, encoding="utf-8")
+
+    assert read_frontmatter_only(f, max_bytes=1024) == body
@@ -23,8 +23,8 @@ def mock_repo():
 async def test_direct_adapter_get_stats(mock_repo):
     adapter = AnkiDirectAdapter(anki_base=None)
 
-    # Mock find_cards
-    mock_repo.col.find_cards.side_effect = lambda q: [101] if "nid:1" in q else []
+    # Mock the nid → cid mapping query
+    mock_repo.col.db.execute.return_value = [(1, 101)]
 
     # Mock get_card
     mock_card = MagicMock()
@@ -43,7 +43,10 @@ async def test_direct_adapter_get_stats(mock_repo):
     mock_repo.col.get_card.return_value = mock_card
 
     # Mock decks
-    mock_repo.col.decks.get.return_value = {"name": "Default"}
+    mock_deck = MagicMock()
+    mock_deck.id = 1
+    mock_deck.name = "Default"
+    mock_repo.col.decks.all_names_and_ids.return_value = [mock_deck]
 
     # Mock get_note for Front field
     mock_note = MagicMock()
@@ -68,9 +71,9 @@ async def test_connect_adapter_get_stats():
     # Mock _invoke
     adapter._invoke = AsyncMock()
 
-    # 1. findCards
+    # 1. notesInfo
     adapter._invoke.side_effect = [
-        [101],  # findCards result
+        [{"noteId": 1, "cards": [101]}],  # notesInfo result
         [
             {  # cardsInfo result
                 "cardId": 101,
@@ -91,7 +94,7 @@ async def test_connect_adapter_get_stats():
     ]
 
     # Note: side_effect iterates.
-    # Logic: findCards -> cardsInfo -> getFSRSStats
+    # Logic: notesInfo -> cardsInfo -> getFSRSStats
 
     stats = await adapter.get_card_stats([1])
 
@@ -34,6 +34,13 @@ def test_cli_help_shows_new_subgroups():
     assert "queue" in result.stdout
 
 
+def test_cli_version():
+    """--version prints the package version and exits cleanly."""
+    result = runner.invoke(app, ["--version"])
+    assert result.exit_code == 0
+    assert result.stdout.startswith("arete ")
+
+
 # --- Init ---
 
 
@@ -13,7 +13,9 @@ SCENARIOS = [
     ("Tab Error.md", "Tab Character Error"),
     ("Tab in List.md", "Tab Character Error"),
     ("Duplicate Key.md", "Duplicate Key Error"),
-    ("Bad Indent.md", "expected <block end>, but found"),
+    # The message text differs between libyaml and the pure-Python loader,
+    # but both point at the mis-indented line, so assert on the line marker.
+    ("Bad Indent.md", "[L5]"),
     ("Bad List.md", "Invalid format for 'cards'"),
     ("Mixed Content.md", "dictionary (key: value)"),  # Expects dict, got str
     ("Null Card.md", "got NoneType"),  # Should be "NoneType" not "empty"